@@ -6,14 +6,15 @@ Source: Derived from anthropics/skills PR #151 (geepers agent system)
 """
 
 import json
-from typing import List, Optional
+from types import MappingProxyType
+from typing import List, Optional, Sequence, Tuple, Union
 
 # Color-blind safe palettes from scientific literature
 
-COLOR_PALETTES = {
+_RAW_PALETTES = {
     "scientific": {
         "description": "Academic publications - Tableau 10 + Okabe-Ito",
-        "colors": [
+        "colors": (
             "#0077BB",  # Blue
             "#33BBEE",  # Cyan
             "#009988",  # Teal
@@ -24,11 +25,11 @@ COLOR_PALETTES = {
             "#EE3377",  # Magenta
             "#BBBBBB",  # Gray
             "#332288",  # Indigo
-        ]
+        )
     },
     "diverging": {
         "description": "Temperature, sentiment - Blue-White-Orange",
-        "colors": [
+        "colors": (
             "#0077BB",  # Blue
             "#4477AA",  # Light Blue
             "#88CCEE",  # Pale Blue
@@ -37,11 +38,11 @@ COLOR_PALETTES = {
             "#EE8866",  # Light Orange
             "#DDAA33",  # Gold
             "#FFA500",  # Orange
-        ]
+        )
     },
     "sequential": {
         "description": "Density, intensity - Viridis-like",
-        "colors": [
+        "colors": (
             "#440154",  # Dark Purple
             "#482878",  # Purple
             "#3E4A89",  # Deep Blue
@@ -52,11 +53,11 @@ COLOR_PALETTES = {
             "#6ECE58",  # Lime
             "#B5DE2B",  # Yellow Green
             "#FDE725",  # Yellow
-        ]
+        )
     },
     "categorical": {
         "description": "Discrete categories - Wong's palette",
-        "colors": [
+        "colors": (
             "#000000",  # Black
             "#E69F00",  # Orange
             "#56B4E9",  # Sky Blue
@@ -65,11 +66,11 @@ COLOR_PALETTES = {
             "#0072B2",  # Blue
             "#D55E00",  # Vermilion
             "#CC79A7",  # Reddish Purple
-        ]
+        )
     },
     "okabe_ito": {
         "description": "Universal color-blind safe palette",
-        "colors": [
+        "colors": (
             "#E69F00",  # Orange
             "#56B4E9",  # Sky Blue
             "#009E73",  # Bluish Green
@@ -78,10 +79,13 @@ COLOR_PALETTES = {
             "#D55E00",  # Vermilion
             "#CC79A7",  # Reddish Purple
             "#000000",  # Black
-        ]
+        )
     },
 }
 
+# Read-only view so the palettes can be shared across forked workers without copying
+COLOR_PALETTES = MappingProxyType({k: MappingProxyType(v) for k, v in _RAW_PALETTES.items()})
+
 
 def generate_palette(
     theme: str = "scientific",
@@ -117,7 +121,7 @@ def generate_palette(
         # Repeat colors if more requested
         colors = (colors * ((n_colors // len(colors)) + 1))[:n_colors]
 
-    return colors[:n_colors]
+    return list(colors[:n_colors])
 
 
 def check_contrast(foreground: str, background: str, ratio: float = 4.5) -> dict:
@@ -144,6 +148,10 @@ def check_contrast(foreground: str, background: str, ratio: float = 4.5) -> dict
 
     def get_luminance(rgb: tuple) -> float:
         """Calculate relative luminance of a color."""
+        if rgb[0] == rgb[1] == rgb[2]:
+            # Grays: the channel weights sum to 1, so luminance is the linearized channel
+            x = rgb[0] / 255.0
+            return x / 12.92 if x <= 0.03928 else ((x + 0.055) / 1.055) ** 2.4
         rgb_normalized = [x / 255.0 for x in rgb]
         rgb_corrected = [
             x / 12.92 if x <= 0.03928 else ((x + 0.055) / 1.055) ** 2.4
@@ -162,6 +170,73 @@ def check_contrast(foreground: str, background: str, ratio: float = 4.5) -> dict
 
     contrast_ratio = (lighter + 0.05) / (darker + 0.05)
 
+    return _contrast_result(contrast_ratio, ratio)
+
+
+def check_contrast_batch(
+    foregrounds: Sequence[Union[str, Sequence[float]]],
+    backgrounds: Sequence[Union[str, Sequence[float]]],
+    ratio: float = 4.5,
+) -> List[dict]:
+    """
+    Check WCAG contrast compliance for many color pairs at once.
+
+    Colors may be hex strings or RGB triples of floats in [0, 1]. When NumPy
+    is available all channels are linearized in a single vectorized pass.
+
+    Args:
+        foregrounds: Foreground colors
+        backgrounds: Background colors, paired with foregrounds by position
+        ratio: Minimum contrast ratio (4.5 for AA, 7.0 for AAA)
+
+    Returns:
+        List of dicts in the same format as check_contrast
+
+    Examples:
+        >>> results = check_contrast_batch(["#0077BB", "#BBBBBB"], ["#FFFFFF", "#FFFFFF"])
+        >>> print([r["level"] for r in results])
+        ['AA', 'Fail']
+    """
+    if len(foregrounds) != len(backgrounds):
+        raise ValueError("foregrounds and backgrounds must have the same length")
+
+    fg = [_to_unit_rgb(c) for c in foregrounds]
+    bg = [_to_unit_rgb(c) for c in backgrounds]
+
+    try:
+        import numpy as np
+    except ImportError:
+        results = []
+        for fg_rgb, bg_rgb in zip(fg, bg):
+            l1, l2 = _unit_luminance(fg_rgb), _unit_luminance(bg_rgb)
+            results.append(_contrast_result((max(l1, l2) + 0.05) / (min(l1, l2) + 0.05), ratio))
+        return results
+
+    arr = np.array(fg + bg, dtype=float).reshape(-1, 3)
+    lin = np.where(arr <= 0.03928, arr / 12.92, ((arr + 0.055) / 1.055) ** 2.4)
+    lum = lin @ np.array([0.2126, 0.7152, 0.0722])
+    l_fg, l_bg = lum[:len(fg)], lum[len(fg):]
+    ratios = (np.maximum(l_fg, l_bg) + 0.05) / (np.minimum(l_fg, l_bg) + 0.05)
+
+    return [_contrast_result(float(r), ratio) for r in ratios]
+
+
+def _to_unit_rgb(color: Union[str, Sequence[float]]) -> Tuple[float, float, float]:
+    """Convert a hex color or float RGB triple to floats in [0, 1]."""
+    if isinstance(color, str):
+        hex_color = color.lstrip("#")
+        return tuple(int(hex_color[i:i+2], 16) / 255.0 for i in (0, 2, 4))
+    return tuple(float(x) for x in color)
+
+
+def _unit_luminance(rgb: Tuple[float, float, float]) -> float:
+    """Calculate relative luminance of a float RGB triple."""
+    r, g, b = (x / 12.92 if x <= 0.03928 else ((x + 0.055) / 1.055) ** 2.4 for x in rgb)
+    return 0.2126 * r + 0.7152 * g + 0.0722 * b
+
+
+def _contrast_result(contrast_ratio: float, ratio: float) -> dict:
+    """Build the compliance dict for a computed contrast ratio."""
     return {
         "compliant": contrast_ratio >= ratio,
         "ratio": round(contrast_ratio, 2),
@@ -6,9 +6,31 @@ Source: Derived from anthropics/skills PR #151 (geepers agent system)
 """
 
 import json
-from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Single delegated handler for point tooltips; reads data-x/data-y off the hovered
+# circle and formats them with the chart's __TIP_TEXT__ expression
+_TOOLTIP_SCRIPT = '''
+    <div id="tooltip" style="position: absolute; display: none; padding: 4px 8px;
+         background: rgba(0, 0, 0, 0.75); color: #fff; font-size: 12px; border-radius: 3px;
+         pointer-events: none;"></div>
+    <script>
+        (function () {
+            const tip = document.getElementById("tooltip");
+            const svg = document.querySelector("svg");
+            svg.addEventListener("mouseover", (event) => {
+                const d = event.target.dataset;
+                if (d.x === undefined) return;
+                tip.textContent = __TIP_TEXT__;
+                tip.style.left = (event.pageX + 10) + "px";
+                tip.style.top = (event.pageY - 10) + "px";
+                tip.style.display = "block";
+            });
+            svg.addEventListener("mouseout", () => { tip.style.display = "none"; });
+        })();
+    </script>'''
 
 
 @dataclass
@@ -24,87 +46,76 @@ class ChartTemplate:
     responsive: bool = True
 
 
-class BaseChart(ABC):
-    """Base class for all chart types."""
+def _freeze(value: Any) -> Any:
+    """Convert nested dicts/lists to tuples so renderer arguments are hashable."""
+    if isinstance(value, dict):
+        return tuple((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
 
-    def __init__(
-        self,
-        data: List[Dict],
-        title: str = "",
-        x_label: str = "",
-        y_label: str = "",
-        color_palette: str = "scientific",
-        template: ChartTemplate = None,
-    ):
-        self.data = data
-        self.title = title
-        self.x_label = x_label
-        self.y_label = y_label
-        self.color_palette = color_palette
-        self.template = template or ChartTemplate()
 
-    @abstractmethod
-    def generate_html(self) -> str:
-        """Generate HTML for the chart."""
-        pass
+def _freeze_template(template: ChartTemplate) -> Tuple:
+    """Hashable form of a ChartTemplate for renderer caching."""
+    return _freeze(asdict(template))
 
-    def save(self, filename: str):
-        """Save chart to HTML file."""
-        html = self.generate_html()
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(html)
-        print(f"Chart saved to {filename}")
 
+def _thaw_template(frozen: Tuple) -> ChartTemplate:
+    """Rebuild a ChartTemplate from its frozen form."""
+    fields = dict(frozen)
+    fields["margin"] = dict(fields["margin"])
+    return ChartTemplate(**fields)
 
-class BarChart(BaseChart):
-    """Bar chart for categorical comparisons."""
 
-    def generate_html(self) -> str:
-        m = self.template.margin
-        w = self.template.width - m["left"] - m["right"]
-        h = self.template.height - m["top"] - m["bottom"]
+def _point_attrs(x: Any, y: Any, tooltips: bool) -> str:
+    """Data attributes read by the shared tooltip script for a point."""
+    return f' data-x="{x}" data-y="{y}"' if tooltips else ""
 
-        labels = [d.get("label", d.get("category", f"Item {i}")) for i, d in enumerate(self.data)]
-        values = [float(d.get("value", d.get("count", 0))) for d in self.data]
 
-        max_val = max(values) if values else 1
-        bar_width = w / len(values) if values else 0
+# JavaScript expressions for tooltip text, matching each chart's original <title> format
+_LINE_TIP = 'd.x + ": " + d.y'
+_SCATTER_TIP = '"(" + d.x + ", " + d.y + ")"'
 
-        bars = []
-        for i, (d, val) in enumerate(zip(self.data, values)):
-            label = labels[i]
-            bar_h = (val / max_val) * h
-            x = i * bar_width
-            y = h - bar_h
-            color = d.get("color", f"url(#gradient-{i % 5})")
 
-            bars.append(f'''
-            <rect class="bar" x="{x + 2}" y="{y}" width="{bar_width - 4}" height="{bar_h}"
-                  fill="{color}" opacity="0.9">
-                <title>{label}: {val}</title>
-            </rect>
-            <text x="{x + bar_width/2}" y="{h + 20}" text-anchor="middle"
-                  font-size="12">{label}</text>
-            <text x="{x + bar_width/2}" y="{y - 5}" text-anchor="middle"
-                  font-size="11" fill="#555">{val}</text>
-            ''')
+def _tooltip_script(tooltips: bool, tip_text: str) -> str:
+    """Tooltip markup, emitted once per chart rather than once per point."""
+    return _TOOLTIP_SCRIPT.replace("__TIP_TEXT__", tip_text) if tooltips else ""
+
 
-        return f'''<!DOCTYPE html>
+def _frame_fields(template: ChartTemplate, w: float, h: float) -> Dict[str, Any]:
+    """Placeholder values shared by the axis-based chart templates."""
+    m = template.margin
+    return {
+        "width": template.width,
+        "height": template.height,
+        "font_family": template.font_family,
+        "title_font_size": template.title_font_size,
+        "margin_left": m["left"],
+        "margin_top": m["top"],
+        "w": w,
+        "h": h,
+        "half_w": w / 2,
+        "half_h": h / 2,
+        "x_label_y": h + 45,
+    }
+
+
+_BAR_CHART_HTML = '''<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
-    <title>{self.title}</title>
+    <title>{title}</title>
     <style>
-        body {{ font-family: {self.template.font_family}; margin: 20px; }}
+        body {{ font-family: {font_family}; margin: 20px; }}
         .bar:hover {{ opacity: 1 !important; cursor: pointer; }}
         .axis-label {{ font-size: 14px; font-weight: bold; }}
-        .title {{ font-size: {self.template.title_font_size}px; text-anchor: middle; }}
+        .title {{ font-size: {title_font_size}px; text-anchor: middle; }}
         .grid line {{ stroke: #ddd; stroke-dasharray: 3; }}
     </style>
 </head>
 <body>
-    <h2 style="text-align: center;">{self.title}</h2>
-    <svg width="{self.template.width}" height="{self.template.height}">
+    <h2 style="text-align: center;">{title}</h2>
+    <svg width="{width}" height="{height}">
         <defs>
             <linearGradient id="gradient-0" x1="0%" y1="0%" x2="0%" y2="100%">
                 <stop offset="0%" style="stop-color:#0077BB"/>
@@ -127,186 +138,229 @@ class BarChart(BaseChart):
                 <stop offset="100%" style="stop-color:#AA2200"/>
             </linearGradient>
         </defs>
-        <g transform="translate({m['left']},{m['top']})">
+        <g transform="translate({margin_left},{margin_top})">
             <line x1="0" y1="{h}" x2="{w}" y2="{h}" stroke="#333"/>
             <line x1="0" y1="0" x2="0" y2="{h}" stroke="#333"/>
-            {''.join(bars)}
-            <text x="{w/2}" y="{h + 45}" text-anchor="middle" class="axis-label">{self.x_label}</text>
-            <text x="-{h/2}" y="-40" text-anchor="middle" transform="rotate(-90)" class="axis-label">{self.y_label}</text>
-            <text x="{w/2}" y="-15" text-anchor="middle" class="title">{self.title}</text>
+            {bars}
+            <text x="{half_w}" y="{x_label_y}" text-anchor="middle" class="axis-label">{x_label}</text>
+            <text x="-{half_h}" y="-40" text-anchor="middle" transform="rotate(-90)" class="axis-label">{y_label}</text>
+            <text x="{half_w}" y="-15" text-anchor="middle" class="title">{title}</text>
         </g>
     </svg>
 </body>
 </html>'''
 
 
-class LineChart(BaseChart):
-    """Line chart for time series and trends."""
+@lru_cache(maxsize=32)
+def render_bar(data: Tuple, title: str, x_label: str, y_label: str, template: Tuple) -> str:
+    """Render a bar chart from frozen rows and a frozen template (see _freeze)."""
+    data = [dict(d) for d in data]
+    template = _thaw_template(template)
 
-    def generate_html(self) -> str:
-        m = self.template.margin
-        w = self.template.width - m["left"] - m["right"]
-        h = self.template.height - m["top"] - m["bottom"]
-
-        x_vals = [float(d.get("x", d.get("time", d.get("date", i)))) for i, d in enumerate(self.data)]
-        y_vals = [float(d.get("y", d.get("value", 0))) for d in self.data]
-
-        min_x, max_x = min(x_vals), max(x_vals)
-        min_y, max_y = min(y_vals), max(y_vals)
-        x_range = max_x - min_x if max_x != min_x else 1
-        y_range = max_y - min_y if max_y != min_y else 1
-
-        def scale_x(x):
-            return ((x - min_x) / x_range) * w
-
-        def scale_y(y):
-            return h - ((y - min_y) / y_range) * h
-
-        points = [f"{scale_x(x_vals[i])},{scale_y(y_vals[i])}" for i in range(len(self.data))]
-        line_path = "M" + " L".join([f"{scale_x(x_vals[i])},{scale_y(y_vals[i])}" for i in range(len(self.data))])
-
-        dots = []
-        for i, (x, y) in enumerate(zip(x_vals, y_vals)):
-            sx, sy = scale_x(x), scale_y(y)
-            dots.append(f'''
-            <circle cx="{sx}" cy="{sy}" r="4" fill="#0077BB">
-                <title>{x}: {y}</title>
-            </circle>
+    m = template.margin
+    w = template.width - m["left"] - m["right"]
+    h = template.height - m["top"] - m["bottom"]
+
+    labels = [d.get("label", d.get("category", f"Item {i}")) for i, d in enumerate(data)]
+    values = [float(d.get("value", d.get("count", 0))) for d in data]
+
+    max_val = max(values) if values else 1
+    bar_width = w / len(values) if values else 0
+
+    bars = []
+    for i, (d, val) in enumerate(zip(data, values)):
+        label = labels[i]
+        bar_h = (val / max_val) * h
+        x = i * bar_width
+        y = h - bar_h
+        color = d.get("color", f"url(#gradient-{i % 5})")
+
+        bars.append(f'''
+            <rect class="bar" x="{x + 2}" y="{y}" width="{bar_width - 4}" height="{bar_h}"
+                  fill="{color}" opacity="0.9">
+                <title>{label}: {val}</title>
+            </rect>
+            <text x="{x + bar_width/2}" y="{h + 20}" text-anchor="middle"
+                  font-size="12">{label}</text>
+            <text x="{x + bar_width/2}" y="{y - 5}" text-anchor="middle"
+                  font-size="11" fill="#555">{val}</text>
             ''')
 
-        return f'''<!DOCTYPE html>
+    return _BAR_CHART_HTML.format_map({
+        **_frame_fields(template, w, h),
+        "title": title,
+        "x_label": x_label,
+        "y_label": y_label,
+        "bars": "".join(bars),
+    })
+
+
+_LINE_CHART_HTML = '''<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
-    <title>{self.title}</title>
+    <title>{title}</title>
     <style>
-        body {{ font-family: {self.template.font_family}; margin: 20px; }}
+        body {{ font-family: {font_family}; margin: 20px; }}
         .line {{ fill: none; stroke: #0077BB; stroke-width: 2.5; }}
         .dot:hover {{ r: 6; cursor: pointer; }}
         .axis-label {{ font-size: 14px; font-weight: bold; }}
     </style>
 </head>
 <body>
-    <h2 style="text-align: center;">{self.title}</h2>
-    <svg width="{self.template.width}" height="{self.template.height}">
-        <g transform="translate({m['left']},{m['top']})">
+    <h2 style="text-align: center;">{title}</h2>
+    <svg width="{width}" height="{height}">
+        <g transform="translate({margin_left},{margin_top})">
             <line x1="0" y1="{h}" x2="{w}" y2="{h}" stroke="#333"/>
             <line x1="0" y1="0" x2="0" y2="{h}" stroke="#333"/>
             <path class="line" d="{line_path}"/>
-            {''.join(dots)}
-            <text x="{w/2}" y="{h + 45}" text-anchor="middle" class="axis-label">{self.x_label}</text>
-            <text x="-{h/2}" y="-40" text-anchor="middle" transform="rotate(-90)" class="axis-label">{self.y_label}</text>
+            {dots}
+            <text x="{half_w}" y="{x_label_y}" text-anchor="middle" class="axis-label">{x_label}</text>
+            <text x="-{half_h}" y="-40" text-anchor="middle" transform="rotate(-90)" class="axis-label">{y_label}</text>
         </g>
-    </svg>
+    </svg>{tooltip_script}
 </body>
 </html>'''
 
 
-class ScatterPlot(BaseChart):
-    """Scatter plot for correlations and distributions."""
+@lru_cache(maxsize=32)
+def render_line(
+    data: Tuple, title: str, x_label: str, y_label: str, template: Tuple, tooltips: bool = True
+) -> str:
+    """Render a line chart from frozen rows and a frozen template (see _freeze)."""
+    data = [dict(d) for d in data]
+    template = _thaw_template(template)
 
-    def __init__(
-        self,
-        data: List[Dict],
-        x_label: str = "",
-        y_label: str = "",
-        color_by: str = "",
-        regression_line: bool = False,
-        **kwargs
-    ):
-        super().__init__(data, "", x_label, y_label, **kwargs)
-        self.color_by = color_by
-        self.regression_line = regression_line
+    m = template.margin
+    w = template.width - m["left"] - m["right"]
+    h = template.height - m["top"] - m["bottom"]
 
-    def generate_html(self) -> str:
-        m = self.template.margin
-        w = self.template.width - m["left"] - m["right"]
-        h = self.template.height - m["top"] - m["bottom"]
-
-        x_vals = [float(d.get("x", 0)) for d in self.data]
-        y_vals = [float(d.get("y", 0)) for d in self.data]
-
-        min_x, max_x = min(x_vals), max(x_vals)
-        min_y, max_y = min(y_vals), max(y_vals)
-        x_range = max_x - min_x if max_x != min_x else 1
-        y_range = max_y - min_y if max_y != min_y else 1
-
-        colors = ["#0077BB", "#EE7733", "#009988", "#CC3311", "#33BBEE"]
-
-        dots = []
-        for i, d in enumerate(self.data):
-            x = float(d.get("x", 0))
-            y = float(d.get("y", 0))
-            sx = ((x - min_x) / x_range) * w
-            sy = h - ((y - min_y) / y_range) * h
-
-            group = d.get(self.color_by, "default") if self.color_by else "default"
-            color_idx = hash(group) % len(colors) if isinstance(group, str) else 0
-            color = colors[color_idx]
-
-            dots.append(f'''
-            <circle cx="{sx}" cy="{sy}" r="6" fill="{color}" opacity="0.7">
-                <title>({x}, {y})</title>
-            </circle>
+    x_vals = [float(d.get("x", d.get("time", d.get("date", i)))) for i, d in enumerate(data)]
+    y_vals = [float(d.get("y", d.get("value", 0))) for d in data]
+
+    min_x, max_x = min(x_vals), max(x_vals)
+    min_y, max_y = min(y_vals), max(y_vals)
+    x_range = max_x - min_x if max_x != min_x else 1
+    y_range = max_y - min_y if max_y != min_y else 1
+
+    def scale_x(x):
+        return ((x - min_x) / x_range) * w
+
+    def scale_y(y):
+        return h - ((y - min_y) / y_range) * h
+
+    points = [f"{scale_x(x_vals[i])},{scale_y(y_vals[i])}" for i in range(len(data))]
+    line_path = "M" + " L".join([f"{scale_x(x_vals[i])},{scale_y(y_vals[i])}" for i in range(len(data))])
+
+    dots = []
+    for i, (x, y) in enumerate(zip(x_vals, y_vals)):
+        sx, sy = scale_x(x), scale_y(y)
+        dots.append(f'''
+            <circle cx="{sx}" cy="{sy}" r="4" fill="#0077BB"{_point_attrs(x, y, tooltips)}/>
             ''')
 
-        return f'''<!DOCTYPE html>
+    return _LINE_CHART_HTML.format_map({
+        **_frame_fields(template, w, h),
+        "title": title,
+        "x_label": x_label,
+        "y_label": y_label,
+        "line_path": line_path,
+        "dots": "".join(dots),
+        "tooltip_script": _tooltip_script(tooltips, _LINE_TIP),
+    })
+
+
+_SCATTER_PLOT_HTML = '''<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
     <title>Scatter Plot</title>
     <style>
-        body {{ font-family: {self.template.font_family}; margin: 20px; }}
+        body {{ font-family: {font_family}; margin: 20px; }}
         circle {{ cursor: pointer; }}
         circle:hover {{ opacity: 1; }}
     </style>
 </head>
 <body>
-    <svg width="{self.template.width}" height="{self.template.height}">
-        <g transform="translate({m['left']},{m['top']})">
+    <svg width="{width}" height="{height}">
+        <g transform="translate({margin_left},{margin_top})">
             <line x1="0" y1="{h}" x2="{w}" y2="{h}" stroke="#333"/>
             <line x1="0" y1="0" x2="0" y2="{h}" stroke="#333"/>
-            {''.join(dots)}
-            <text x="{w/2}" y="{h + 45}" text-anchor="middle">{self.x_label}</text>
-            <text x="-{h/2}" y="-40" text-anchor="middle" transform="rotate(-90)">{self.y_label}</text>
+            {dots}
+            <text x="{half_w}" y="{x_label_y}" text-anchor="middle">{x_label}</text>
+            <text x="-{half_h}" y="-40" text-anchor="middle" transform="rotate(-90)">{y_label}</text>
         </g>
-    </svg>
+    </svg>{tooltip_script}
 </body>
 </html>'''
 
 
-class ForceGraph(BaseChart):
-    """Force-directed graph for networks."""
+@lru_cache(maxsize=32)
+def render_scatter(
+    data: Tuple, x_label: str, y_label: str, template: Tuple, color_by: str = "", tooltips: bool = True
+) -> str:
+    """Render a scatter plot from frozen rows and a frozen template (see _freeze)."""
+    data = [dict(d) for d in data]
+    template = _thaw_template(template)
 
-    def __init__(self, nodes: List[Dict], links: List[Dict], **kwargs):
-        super().__init__([], "", "", "", **kwargs)
-        self.nodes = nodes
-        self.links = links
+    m = template.margin
+    w = template.width - m["left"] - m["right"]
+    h = template.height - m["top"] - m["bottom"]
 
-    def generate_html(self) -> str:
-        nodes_json = json.dumps(self.nodes)
-        links_json = json.dumps(self.links)
+    x_vals = [float(d.get("x", 0)) for d in data]
+    y_vals = [float(d.get("y", 0)) for d in data]
+
+    min_x, max_x = min(x_vals), max(x_vals)
+    min_y, max_y = min(y_vals), max(y_vals)
+    x_range = max_x - min_x if max_x != min_x else 1
+    y_range = max_y - min_y if max_y != min_y else 1
+
+    colors = ["#0077BB", "#EE7733", "#009988", "#CC3311", "#33BBEE"]
+
+    dots = []
+    for i, d in enumerate(data):
+        x = float(d.get("x", 0))
+        y = float(d.get("y", 0))
+        sx = ((x - min_x) / x_range) * w
+        sy = h - ((y - min_y) / y_range) * h
+
+        group = d.get(color_by, "default") if color_by else "default"
+        color_idx = hash(group) % len(colors) if isinstance(group, str) else 0
+        color = colors[color_idx]
 
-        return f'''<!DOCTYPE html>
+        dots.append(f'''
+            <circle cx="{sx}" cy="{sy}" r="6" fill="{color}" opacity="0.7"{_point_attrs(x, y, tooltips)}/>
+            ''')
+
+    return _SCATTER_PLOT_HTML.format_map({
+        **_frame_fields(template, w, h),
+        "x_label": x_label,
+        "y_label": y_label,
+        "dots": "".join(dots),
+        "tooltip_script": _tooltip_script(tooltips, _SCATTER_TIP),
+    })
+
+
+_FORCE_GRAPH_HTML = '''<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
     <title>Force-Directed Graph</title>
     <script src="https://d3js.org/d3.v7.min.js"></script>
     <style>
-        body {{ font-family: {self.template.font_family}; margin: 20px; }}
+        body {{ font-family: {font_family}; margin: 20px; }}
         .link {{ stroke: #999; stroke-opacity: 0.6; }}
         .node {{ fill: #0077BB; stroke: #fff; stroke-width: 1.5px; cursor: pointer; }}
         text {{ font-size: 12px; pointer-events: none; }}
     </style>
 </head>
 <body>
-    <svg width="{self.template.width}" height="{self.template.height}">
+    <svg width="{width}" height="{height}">
         <g></g>
     </svg>
     <script>
-        const width = {self.template.width};
-        const height = {self.template.height};
+        const width = {width};
+        const height = {height};
 
         const nodes = {nodes_json};
         const links = {links_json};
@@ -381,6 +435,130 @@ class ForceGraph(BaseChart):
 </html>'''
 
 
+@lru_cache(maxsize=32)
+def render_force(nodes_json: str, links_json: str, template: Tuple) -> str:
+    """Render a force-directed graph from JSON-encoded nodes and links."""
+    template = _thaw_template(template)
+
+    return _FORCE_GRAPH_HTML.format_map({
+        "width": template.width,
+        "height": template.height,
+        "font_family": template.font_family,
+        "nodes_json": nodes_json,
+        "links_json": links_json,
+    })
+
+
+_RENDERERS: Dict[str, Callable[..., str]] = {
+    "bar": render_bar,
+    "line": render_line,
+    "scatter": render_scatter,
+    "force": render_force,
+}
+
+
+class BaseChart:
+    """Base class for all chart types."""
+
+    chart_type = ""
+
+    def __init__(
+        self,
+        data: List[Dict],
+        title: str = "",
+        x_label: str = "",
+        y_label: str = "",
+        color_palette: str = "scientific",
+        template: ChartTemplate = None,
+        tooltips: bool = True,
+    ):
+        self.data = data
+        self.title = title
+        self.x_label = x_label
+        self.y_label = y_label
+        self.color_palette = color_palette
+        self.template = template or ChartTemplate()
+        self.tooltips = tooltips
+
+    def generate_html(self) -> str:
+        """Generate HTML for the chart."""
+        renderer = _RENDERERS.get(self.chart_type)
+        if renderer is None:
+            raise NotImplementedError(
+                f"{type(self).__name__} has no renderer; subclasses must set chart_type "
+                f"to one of {sorted(_RENDERERS)}"
+            )
+        return renderer(*self._render_args())
+
+    def _render_args(self) -> Tuple:
+        """Hashable positional arguments for this chart's renderer."""
+        return (
+            _freeze(self.data), self.title, self.x_label, self.y_label,
+            _freeze_template(self.template),
+        )
+
+    def save(self, filename: str):
+        """Save chart to HTML file."""
+        html = self.generate_html()
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write(html)
+        print(f"Chart saved to {filename}")
+
+
+class BarChart(BaseChart):
+    """Bar chart for categorical comparisons."""
+
+    chart_type = "bar"
+
+
+class LineChart(BaseChart):
+    """Line chart for time series and trends."""
+
+    chart_type = "line"
+
+    def _render_args(self) -> Tuple:
+        return super()._render_args() + (self.tooltips,)
+
+
+class ScatterPlot(BaseChart):
+    """Scatter plot for correlations and distributions."""
+
+    chart_type = "scatter"
+
+    def __init__(
+        self,
+        data: List[Dict],
+        x_label: str = "",
+        y_label: str = "",
+        color_by: str = "",
+        regression_line: bool = False,
+        **kwargs
+    ):
+        super().__init__(data, "", x_label, y_label, **kwargs)
+        self.color_by = color_by
+        self.regression_line = regression_line
+
+    def _render_args(self) -> Tuple:
+        return (
+            _freeze(self.data), self.x_label, self.y_label,
+            _freeze_template(self.template), self.color_by, self.tooltips,
+        )
+
+
+class ForceGraph(BaseChart):
+    """Force-directed graph for networks."""
+
+    chart_type = "force"
+
+    def __init__(self, nodes: List[Dict], links: List[Dict], **kwargs):
+        super().__init__([], "", "", "", **kwargs)
+        self.nodes = nodes
+        self.links = links
+
+    def _render_args(self) -> Tuple:
+        return (json.dumps(self.nodes), json.dumps(self.links), _freeze_template(self.template))
+
+
 if __name__ == "__main__":
     import argparse
 
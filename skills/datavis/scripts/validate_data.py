@@ -7,12 +7,20 @@ Source: Derived from anthropics/skills PR #151 (geepers agent system)
 
 import csv
 import json
+import numpy as np
 import pandas as pd
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set, Tuple
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
+Rows = Union[List[Dict], pd.DataFrame]
 
-@dataclass
+# Accepted boolean spellings, listed per case so cells need no lowercasing
+_BOOL_LITERALS = frozenset(("true", "false", "True", "False", "TRUE", "FALSE", "1", "0"))
+
+
+@dataclass(slots=True)
 class ValidationIssue:
     """Represents a validation issue."""
     type: str
@@ -22,7 +30,7 @@ class ValidationIssue:
     severity: str = "error"  # error, warning, info
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of data validation."""
     is_valid: bool
@@ -36,9 +44,19 @@ class ValidationResult:
             self.is_valid = False
 
 
-def load_data(input_path: str) -> Tuple[List[Dict], str]:
-    """Load data from CSV or JSON file."""
+def load_data(
+    input_path: str, chunksize: Optional[int] = None
+) -> Tuple[Union[List[Dict], Iterator[pd.DataFrame]], str]:
+    """Load data from CSV or JSON file.
+
+    With chunksize, CSV files are returned as an iterator of DataFrame
+    chunks of that many rows instead of being read into memory at once.
+    Chunked reads reject rows with more fields than the header, which
+    csv.DictReader tolerates.
+    """
     if input_path.endswith(".csv"):
+        if chunksize:
+            return _iter_csv_chunks(input_path, chunksize), "csv"
         with open(input_path, "r", encoding="utf-8") as f:
             reader = csv.DictReader(f)
             data = list(reader)
@@ -51,154 +69,597 @@ def load_data(input_path: str) -> Tuple[List[Dict], str]:
         raise ValueError(f"Unsupported file format: {input_path}")
 
 
-def check_completeness(data: List[Dict], required_columns: List[str]) -> List[ValidationIssue]:
-    """Check for missing values in required columns."""
+def _iter_csv_chunks(input_path: str, chunksize: int) -> Iterator[pd.DataFrame]:
+    """Yield a CSV file as string-typed DataFrame chunks.
+
+    Uses PyArrow's multithreaded streaming reader when it is installed, in
+    which case chunks follow its 8 MiB read blocks rather than chunksize.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        pacsv = None
+
+    if pacsv is not None:
+        with open(input_path, "r", encoding="utf-8", newline="") as f:
+            header = next(csv.reader(f), [])
+        # Keep every column as text, with empty cells as "", to match DictReader
+        reader = pacsv.open_csv(
+            input_path,
+            read_options=pacsv.ReadOptions(block_size=8 << 20),
+            parse_options=pacsv.ParseOptions(newlines_in_values=True),
+            convert_options=pacsv.ConvertOptions(
+                column_types={name: pa.string() for name in header},
+                strings_can_be_null=False,
+            ),
+        )
+        for batch in reader:
+            yield batch.to_pandas()
+        return
+
+    with pd.read_csv(input_path, chunksize=chunksize, dtype=str,
+                     keep_default_na=False, encoding="utf-8") as reader:
+        yield from reader
+
+
+def _as_frame(data: Rows) -> pd.DataFrame:
+    """Return data as a DataFrame, building one from row dicts if needed."""
+    return data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+
+
+def _column(df: pd.DataFrame, col: str) -> pd.Series:
+    """Get a column, treating a column absent from every row as all-missing."""
+    if col in df.columns:
+        return df[col]
+    return pd.Series([None] * len(df), index=df.index, dtype=object)
+
+
+def _missing_mask(values: pd.Series) -> pd.Series:
+    """True where a cell is missing or an empty string."""
+    return values.isna() | values.eq("")
+
+
+def _blank_mask(values: pd.Series) -> pd.Series:
+    """True where a cell is missing or a whitespace-only string."""
+    mask = values.isna()
+    try:
+        mask |= values.str.strip().eq("").fillna(False).astype(bool)
+    except AttributeError:
+        pass  # No string values in this column
+    return mask
+
+
+def _to_numeric(values: pd.Series) -> pd.Series:
+    """Coerce values to floats the way float() would, with failures as NaN.
+
+    pd.to_numeric rejects a few spellings float() accepts ("1_000",
+    non-ASCII digits), so non-empty cells it leaves as NaN, usually few,
+    are retried with float() one by one.
+    """
+    numeric = pd.to_numeric(values, errors="coerce")
+    idx = np.flatnonzero((numeric.isna() & ~_missing_mask(values)).to_numpy())
+    if len(idx) == 0:
+        return numeric
+    numeric = numeric.astype(float)
+    for i, value in zip(idx, values.iloc[idx]):
+        try:
+            numeric.iat[i] = float(value)
+        except (TypeError, ValueError, OverflowError):
+            pass
+    return numeric
+
+
+def _numeric_column(df: pd.DataFrame, col: str, numeric: Optional[Dict[str, pd.Series]] = None) -> pd.Series:
+    """A column coerced to numbers, with unparseable cells as NaN.
+
+    ``numeric`` memoizes coerced columns so the range and type checks of
+    one frame parse each column only once; it is updated in place.
+    """
+    if numeric is None:
+        return _to_numeric(_column(df, col))
+    if col not in numeric:
+        numeric[col] = _to_numeric(_column(df, col))
+    return numeric[col]
+
+
+def _recheck(values: pd.Series, bad: pd.Series, convert: Callable[[Any], Any]) -> pd.Series:
+    """Clear flags on cells the Python converter accepts after all.
+
+    The vectorized parsers are stricter or looser than float()/int() on a
+    few spellings ("nan", "1_000", "3.0"), so only flagged cells, usually
+    few, are confirmed one by one against the original rule.
+    """
+    idx = np.flatnonzero(bad.to_numpy())
+    if len(idx) == 0:
+        return bad
+    ok = np.zeros(len(idx), dtype=bool)
+    for i, value in enumerate(values.iloc[idx]):
+        try:
+            convert(value)
+            ok[i] = True
+        except (TypeError, ValueError, OverflowError):
+            pass
+    bad = bad.copy()
+    bad.iloc[idx[ok]] = False
+    return bad
+
+
+def _bad_numeric(values: pd.Series, numeric: Optional[pd.Series]) -> pd.Series:
+    """Values that float() rejects, given the raw and coerced column."""
+    return _recheck(values, numeric.isna(), float)
+
+
+def _bad_integer(values: pd.Series, numeric: Optional[pd.Series] = None) -> pd.Series:
+    """Values that int() rejects: exponent and decimal strings fail."""
+    if pd.api.types.is_numeric_dtype(values):
+        # Numeric dtypes: int() accepts every finite number, truncating floats
+        return pd.Series(~np.isfinite(values.to_numpy(dtype=float, na_value=np.nan)), index=values.index)
+    bad = ~values.astype(str).str.fullmatch(r"\s*[+-]?\d+\s*")
+    return _recheck(values, bad, int)
+
+
+def _bad_boolean(values: pd.Series, numeric: Optional[pd.Series] = None) -> pd.Series:
+    """Values that are not a recognised boolean literal."""
+    return ~values.astype(str).isin(_BOOL_LITERALS)
+
+
+# Types whose checks also take the coerced numeric column
+_NUMERIC_TYPES = frozenset(("numeric",))
+
+# expected type -> vectorized check returning True for values that fail to parse
+_TYPE_CHECKS = {
+    "numeric": _bad_numeric,
+    "integer": _bad_integer,
+    "boolean": _bad_boolean,
+}
+
+
+@lru_cache(maxsize=128)
+def _compile_type_checks(
+    column_types: Tuple[Tuple[str, str], ...]
+) -> Tuple[Tuple[str, str, Callable[[pd.Series, Optional[pd.Series]], pd.Series]], ...]:
+    """Resolve each column's expected type to its check, dropping unknown types.
+
+    Takes column_types as items so the result is cached across calls that
+    validate many files against the same schema.
+    """
+    return tuple(
+        (col, expected_type, _TYPE_CHECKS[expected_type])
+        for col, expected_type in column_types
+        if expected_type in _TYPE_CHECKS
+    )
+
+
+@lru_cache(maxsize=128)
+def _compile_ranges(column_ranges: Tuple[Tuple[str, Tuple[float, float]], ...]) -> Tuple[Tuple[str, float, float], ...]:
+    """Flatten (column, (min, max)) items to (column, min, max), cached like type checks."""
+    return tuple((col, min_val, max_val) for col, (min_val, max_val) in column_ranges)
+
+
+@lru_cache(maxsize=128)
+def _parse_range_specs(specs: Tuple[str, ...]) -> Tuple[Tuple[str, Tuple[float, float]], ...]:
+    """Parse --ranges "column:min:max" specs, skipping malformed ones."""
+    parsed = []
+    for spec in specs:
+        parts = spec.split(":")
+        if len(parts) == 3:
+            parsed.append((parts[0], (float(parts[1]), float(parts[2]))))
+    return tuple(parsed)
+
+
+@lru_cache(maxsize=128)
+def _parse_type_specs(specs: Tuple[str, ...]) -> Tuple[Tuple[str, str], ...]:
+    """Parse --types "column:type" specs, skipping malformed ones."""
+    parsed = []
+    for spec in specs:
+        parts = spec.split(":")
+        if len(parts) == 2:
+            parsed.append((parts[0], parts[1]))
+    return tuple(parsed)
+
+
+def _row_numbers(df: pd.DataFrame) -> np.ndarray:
+    """1-based row numbers for each row, taken from the frame's index.
+
+    Shards keep the index labels of the full frame, so issues raised on a
+    shard still report the row's position in the whole dataset.
+    """
+    return df.index.to_numpy() + 1
+
+
+def check_completeness(
+    data: Rows, required_columns: List[str], max_issues: Optional[int] = None
+) -> List[ValidationIssue]:
+    """Check for missing values in required columns.
+
+    At most max_issues issues are reported per column, in row order.
+    """
+    df = _as_frame(data)
+    rows = _row_numbers(df)
     issues = []
 
-    for idx, row in enumerate(data):
-        for col in required_columns:
-            value = row.get(col)
-            if value is None or (isinstance(value, str) and value.strip() == ""):
-                issues.append(ValidationIssue(
-                    type="completeness",
-                    column=col,
-                    row=idx + 1,
-                    message=f"Missing value in column '{col}' at row {idx + 1}",
-                    severity="error"
-                ))
+    for col in required_columns:
+        for idx in np.flatnonzero(_blank_mask(_column(df, col)).to_numpy())[:max_issues]:
+            row = int(rows[idx])
+            issues.append(ValidationIssue(
+                type="completeness",
+                column=col,
+                row=row,
+                message=f"Missing value in column '{col}' at row {row}",
+                severity="error"
+            ))
 
+    # Columns are scanned one at a time; the stable sort restores row order
+    issues.sort(key=lambda issue: issue.row)
     return issues
 
 
-def check_range(data: List[Dict], column_ranges: Dict[str, Tuple[float, float]]) -> List[ValidationIssue]:
-    """Check if values are within expected ranges."""
+def check_range(
+    data: Rows,
+    column_ranges: Dict[str, Tuple[float, float]],
+    numeric: Optional[Dict[str, pd.Series]] = None,
+) -> List[ValidationIssue]:
+    """Check if values are within expected ranges.
+
+    Issues are reported in row order. ``numeric`` is an optional memo of coerced columns shared with check_type.
+    """
+    df = _as_frame(data)
+    rows = _row_numbers(df)
     issues = []
 
-    for idx, row in enumerate(data):
-        for col, (min_val, max_val) in column_ranges.items():
-            value_str = row.get(col)
-            if value_str is not None and value_str != "":
-                try:
-                    value = float(value_str)
-                    if value < min_val or value > max_val:
-                        issues.append(ValidationIssue(
-                            type="range",
-                            column=col,
-                            row=idx + 1,
-                            message=f"Value {value} in '{col}' is outside range [{min_val}, {max_val}]",
-                            severity="warning"
-                        ))
-                except ValueError:
-                    pass  # Type check will catch non-numeric values
+    for col, min_val, max_val in _compile_ranges(tuple((col, tuple(bounds)) for col, bounds in column_ranges.items())):
+        # Non-numeric cells coerce to NaN, which fails both comparisons;
+        # the type check reports those
+        values = _numeric_column(df, col, numeric).to_numpy(dtype=float)
+        for idx in np.flatnonzero((values < min_val) | (values > max_val)):
+            issues.append(ValidationIssue(
+                type="range",
+                column=col,
+                row=int(rows[idx]),
+                message=f"Value {float(values[idx])} in '{col}' is outside range [{min_val}, {max_val}]",
+                severity="warning"
+            ))
 
+    issues.sort(key=lambda issue: issue.row)
     return issues
 
 
-def check_type(data: List[Dict], column_types: Dict[str, str]) -> List[ValidationIssue]:
-    """Check if values have correct data types."""
+def check_type(
+    data: Rows,
+    column_types: Dict[str, str],
+    max_issues: Optional[int] = None,
+    numeric: Optional[Dict[str, pd.Series]] = None,
+) -> List[ValidationIssue]:
+    """Check if values have correct data types.
+
+    At most max_issues issues are reported per column, in row order.
+    ``numeric`` is an optional memo of coerced columns shared with
+    check_range.
+    """
+    df = _as_frame(data)
+    rows = _row_numbers(df)
     issues = []
 
-    for idx, row in enumerate(data):
-        for col, expected_type in column_types.items():
-            value = row.get(col)
-            if value is None or value == "":
-                continue
+    for col, expected_type, bad_values in _compile_type_checks(tuple(column_types.items())):
+        if col not in df.columns:
+            continue
 
-            try:
-                if expected_type == "numeric":
-                    float(value)
-                elif expected_type == "integer":
-                    int(value)
-                elif expected_type == "boolean":
-                    if value.lower() not in ["true", "false", "1", "0"]:
-                        raise ValueError("Not a boolean")
-            except ValueError:
-                issues.append(ValidationIssue(
-                    type="type",
-                    column=col,
-                    row=idx + 1,
-                    message=f"Value '{value}' in '{col}' is not {expected_type}",
-                    severity="error"
-                ))
+        values = df[col]
+        parsed = _numeric_column(df, col, numeric) if expected_type in _NUMERIC_TYPES else None
+        bad = bad_values(values, parsed) & ~_missing_mask(values)
+        for idx in np.flatnonzero(bad.to_numpy())[:max_issues]:
+            issues.append(ValidationIssue(
+                type="type",
+                column=col,
+                row=int(rows[idx]),
+                message=f"Value '{values.iat[idx]}' in '{col}' is not {expected_type}",
+                severity="error"
+            ))
 
+    issues.sort(key=lambda issue: issue.row)
     return issues
 
 
-def check_uniqueness(data: List[Dict], key_columns: List[str]) -> List[ValidationIssue]:
-    """Check for duplicate keys."""
+def _key_tuples(df: pd.DataFrame, key_columns: List[str]) -> Iterator[Tuple]:
+    """Yield each row's key as a tuple, with None for missing values.
+
+    Keys are zipped from whole columns rather than built cell by cell, and
+    NaN is mapped to None so missing values compare equal.
+    """
+    columns = [_column(df, col).astype(object).where(lambda s: s.notna(), None).tolist()
+               for col in key_columns]
+    return zip(*columns)
+
+
+def check_uniqueness(
+    data: Rows,
+    key_columns: List[str],
+    seen: Optional[Dict[Tuple, int]] = None,
+    early_exit: bool = False,
+) -> List[ValidationIssue]:
+    """Check for duplicate keys.
+
+    ``seen`` maps each key to the row it first appeared on. Pass the same
+    dict across calls to detect duplicates spanning several pieces of one
+    dataset; it is updated in place. With early_exit, stop at the first
+    duplicate.
+    """
+    df = _as_frame(data)
     issues = []
-    seen: Set[Tuple] = set()
+    seen = {} if seen is None else seen
+    column = ", ".join(key_columns)
 
-    for idx, row in enumerate(data):
-        key = tuple(row.get(col) for col in key_columns)
-        if key in seen:
+    for row, key in zip(_row_numbers(df).tolist(), _key_tuples(df, key_columns)):
+        # setdefault does the membership test and the insert in one lookup
+        if seen.setdefault(key, row) != row:
             issues.append(ValidationIssue(
                 type="uniqueness",
-                column=", ".join(key_columns),
-                row=idx + 1,
+                column=column,
+                row=row,
                 message=f"Duplicate key found: {key}",
                 severity="error"
             ))
-        else:
-            seen.add(key)
+            if early_exit:
+                break
 
     return issues
 
 
-def check_ordering(data: List[Dict], order_columns: List[str], ascending: List[bool] = None) -> List[ValidationIssue]:
-    """Check if data is properly sorted for visualization."""
+def check_ordering(
+    data: Rows,
+    order_columns: List[str],
+    ascending: List[bool] = None,
+    max_issues: Optional[int] = None,
+) -> List[ValidationIssue]:
+    """Check if data is properly sorted for visualization.
+
+    Each row is reported at most once, for the first column out of order.
+    At most max_issues issues are reported per column.
+    """
     if ascending is None:
         ascending = [True] * len(order_columns)
 
+    df = _as_frame(data)
+    rows = _row_numbers(df)
+    n_pairs = max(len(df) - 1, 0)
+    flagged = np.zeros(n_pairs, dtype=bool)
+    # Scratch masks reused for every column so the scan allocates nothing per column
+    bad = np.empty(n_pairs, dtype=bool)
+    new = np.empty(n_pairs, dtype=bool)
+    found = []
+
+    for col, asc in zip(order_columns, ascending):
+        if flagged.all():
+            break  # Every row already has an issue
+        values = _column(df, col).to_numpy(dtype=float, na_value=0.0)
+        # Compare every adjacent pair at once; bad[i] covers rows i and i + 1
+        (np.greater if asc else np.less)(values[:-1], values[1:], out=bad)
+        np.greater(bad, flagged, out=new)  # bad and not yet flagged
+        flagged |= bad
+        found.extend((idx, col) for idx in np.flatnonzero(new)[:max_issues])
+
     issues = []
+    for idx, col in sorted(found):
+        row = int(rows[idx + 1])
+        issues.append(ValidationIssue(
+            type="ordering",
+            column=col,
+            row=row,
+            message=f"Data not sorted correctly in '{col}' at row {row}",
+            severity="warning"
+        ))
 
-    for idx in range(1, len(data)):
-        for col, asc in zip(order_columns, ascending):
-            val1 = float(data[idx - 1].get(col, 0))
-            val2 = float(data[idx].get(col, 0))
-
-            if asc and val1 > val2:
-                issues.append(ValidationIssue(
-                    type="ordering",
-                    column=col,
-                    row=idx + 1,
-                    message=f"Data not sorted correctly in '{col}' at row {idx + 1}",
-                    severity="warning"
-                ))
-                break
-            elif not asc and val1 < val2:
-                issues.append(ValidationIssue(
-                    type="ordering",
-                    column=col,
-                    row=idx + 1,
-                    message=f"Data not sorted correctly in '{col}' at row {idx + 1}",
-                    severity="warning"
+    return issues
+
+
+# Check names in the order their issues are reported
+_CHECK_ORDER = ("completeness", "range", "type", "uniqueness", "ordering")
+
+# Below this many rows, starting worker processes costs more than it saves
+_PARALLEL_MIN_ROWS = 50_000
+
+
+def _run_checks(
+    df: pd.DataFrame,
+    checks: List[str],
+    required_columns: Optional[List[str]],
+    column_ranges: Optional[Dict[str, Tuple[float, float]]],
+    column_types: Optional[Dict[str, str]],
+    key_columns: Optional[List[str]],
+    order_columns: Optional[List[str]],
+    max_issues: Optional[int] = None,
+    early_exit: bool = False,
+    seen: Optional[Dict[Tuple, int]] = None,
+) -> Dict[str, List[ValidationIssue]]:
+    """Run the requested checks on one frame, returning issues per check.
+
+    With early_exit, checks stop after the first one that reports an error,
+    and each check builds at most one issue per column.
+    """
+    found = {}
+    # Columns coerced to numbers, shared by the range and type checks
+    numeric: Dict[str, pd.Series] = {}
+    if early_exit:
+        max_issues = 1
+
+    def failed(name: str) -> bool:
+        return early_exit and any(issue.severity == "error" for issue in found[name])
+
+    if "completeness" in checks and required_columns:
+        found["completeness"] = check_completeness(df, required_columns, max_issues)
+        if failed("completeness"):
+            return found
+
+    if "range" in checks and column_ranges:
+        found["range"] = check_range(df, column_ranges, numeric)
+
+    if "type" in checks and column_types:
+        found["type"] = check_type(df, column_types, 1 if early_exit else None, numeric)
+        if failed("type"):
+            return found
+
+    if "uniqueness" in checks and key_columns:
+        found["uniqueness"] = check_uniqueness(df, key_columns, seen, early_exit)
+        if failed("uniqueness"):
+            return found
+
+    if "ordering" in checks and order_columns:
+        found["ordering"] = check_ordering(df, order_columns, max_issues=max_issues)
+
+    return found
+
+
+def _cap_per_column(issues: List[ValidationIssue], max_issues: Optional[int]) -> List[ValidationIssue]:
+    """Keep the first max_issues issues for each column."""
+    if max_issues is None:
+        return issues
+    counts: Dict[Optional[str], int] = {}
+    kept = []
+    for issue in issues:
+        counts[issue.column] = counts.get(issue.column, 0) + 1
+        if counts[issue.column] <= max_issues:
+            kept.append(issue)
+    return kept
+
+
+def _check_piece(job: Tuple) -> Tuple[Dict[str, List[ValidationIssue]], Dict[Tuple, int]]:
+    """Run checks on one piece of a dataset and return its first-seen keys.
+
+    Module-level so it can be sent to worker processes.
+    """
+    piece, checks, *columns = job
+    seen: Dict[Tuple, int] = {}
+    return _run_checks(piece, checks, *columns, seen=seen), seen
+
+
+def _shards(df: pd.DataFrame, n: int) -> List[pd.DataFrame]:
+    """Split a frame into n contiguous row shards."""
+    bounds = np.linspace(0, len(df), n + 1, dtype=int).tolist()
+    return [df.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+
+
+def _check_pieces(
+    pieces: Iterable[Rows],
+    checks: List[str],
+    required_columns: Optional[List[str]],
+    column_ranges: Optional[Dict[str, Tuple[float, float]]],
+    column_types: Optional[Dict[str, str]],
+    key_columns: Optional[List[str]],
+    order_columns: Optional[List[str]],
+    max_issues: Optional[int] = None,
+    early_exit: bool = False,
+    num_workers: int = 1,
+) -> Dict[str, List[ValidationIssue]]:
+    """Check consecutive pieces of one dataset and merge their issues.
+
+    Pieces are renumbered with a running row offset and checked
+    independently, in a process pool when num_workers > 1. Duplicate keys
+    that span pieces and ordering across piece boundaries are checked here
+    after the merge. At most num_workers pieces are held in memory at once.
+    With early_exit, no further pieces are read once an error is found.
+    """
+    columns = (required_columns, column_ranges, column_types, key_columns, order_columns,
+               max_issues, early_exit)
+    boundaries: List[pd.DataFrame] = []
+
+    def jobs() -> Iterator[Tuple]:
+        offset = 0
+        last_row = None
+        for piece in pieces:
+            piece = _as_frame(piece)
+            piece = piece.set_axis(pd.RangeIndex(offset, offset + len(piece)), axis=0)
+            offset += len(piece)
+            if len(piece) == 0:
+                continue
+            if last_row is not None:
+                boundaries.append(pd.concat([last_row, piece.iloc[:1]]))
+            last_row = piece.iloc[-1:]
+            yield (piece, checks, *columns)
+
+    found: Dict[str, List[ValidationIssue]] = {}
+    seen: Dict[Tuple, int] = {}
+
+    def merge(piece_found: Dict[str, List[ValidationIssue]], piece_seen: Dict[Tuple, int]):
+        for name, issues in piece_found.items():
+            found.setdefault(name, []).extend(issues)
+        for key, row in piece_seen.items():
+            if key in seen:
+                found["uniqueness"].append(ValidationIssue(
+                    type="uniqueness",
+                    column=", ".join(key_columns),
+                    row=row,
+                    message=f"Duplicate key found: {key}",
+                    severity="error"
                 ))
+            else:
+                seen[key] = row
+
+    def failed() -> bool:
+        return early_exit and any(
+            issue.severity == "error" for issues in found.values() for issue in issues
+        )
+
+    job_iter = jobs()
+    if num_workers > 1:
+        import multiprocessing
+
+        with multiprocessing.Pool(num_workers) as pool:
+            for window in iter(lambda: list(islice(job_iter, num_workers)), []):
+                for result in pool.map(_check_piece, window):
+                    merge(*result)
+                if failed():
+                    break
+    else:
+        for job in job_iter:
+            merge(*_check_piece(job))
+            if failed():
                 break
 
-    return issues
+    if "ordering" in found:
+        for pair in boundaries:
+            found["ordering"].extend(check_ordering(pair, order_columns))
+
+    for name in ("uniqueness", "ordering"):
+        if name in found:
+            found[name].sort(key=lambda issue: issue.row)
+
+    for name in ("completeness", "ordering"):
+        if name in found:
+            found[name] = _cap_per_column(found[name], max_issues)
+
+    return found
 
 
 def validate_for_viz(
-    data: List[Dict],
+    data: Union[Rows, Iterable[pd.DataFrame]],
     required_columns: List[str] = None,
     column_ranges: Dict[str, Tuple[float, float]] = None,
     column_types: Dict[str, str] = None,
     key_columns: List[str] = None,
     order_columns: List[str] = None,
     checks: List[str] = None,
+    num_workers: int = 1,
+    max_issues: Optional[int] = 1000,
+    early_exit: bool = False,
 ) -> ValidationResult:
     """
     Validate data for visualization.
 
     Args:
-        data: List of dictionaries representing rows
+        data: List of dictionaries representing rows, a DataFrame, or an
+            iterable of DataFrame chunks (see load_data) checked one at a time
         required_columns: Columns that must have values
         column_ranges: Dict of column -> (min, max) tuples
         column_types: Dict of column -> type (numeric, integer, boolean)
         key_columns: Columns that form unique keys
         order_columns: Columns that should be ordered
         checks: List of checks to perform (completeness, range, type, uniqueness, ordering)
+        num_workers: Worker processes to shard large datasets across (1 = no pool)
+        max_issues: Most completeness and ordering issues to report per column
+            (None = all); is_valid still reflects every failure
+        early_exit: Stop at the first error, for callers that only need
+            is_valid; issues then end with that error
 
     Returns:
         ValidationResult with is_valid status and any issues
@@ -214,21 +675,27 @@ def validate_for_viz(
     """
     result = ValidationResult(is_valid=True)
     checks = checks or ["completeness", "type", "range"]
+    columns = (required_columns, column_ranges, column_types, key_columns, order_columns,
+               max_issues, early_exit)
 
-    if "completeness" in checks and required_columns:
-        result.issues.extend(check_completeness(data, required_columns))
-
-    if "range" in checks and column_ranges:
-        result.issues.extend(check_range(data, column_ranges))
-
-    if "type" in checks and column_types:
-        result.issues.extend(check_type(data, column_types))
+    if isinstance(data, (list, pd.DataFrame)):
+        df = _as_frame(data)
+        if num_workers > 1 and len(df) >= _PARALLEL_MIN_ROWS:
+            found = _check_pieces(_shards(df, num_workers), checks, *columns, num_workers)
+        else:
+            found = _run_checks(df, checks, *columns)
+    else:
+        found = _check_pieces(data, checks, *columns, num_workers)
 
-    if "uniqueness" in checks and key_columns:
-        result.issues.extend(check_uniqueness(data, key_columns))
+    for name in _CHECK_ORDER:
+        result.issues.extend(found.get(name, []))
 
-    if "ordering" in checks and order_columns:
-        result.issues.extend(check_ordering(data, order_columns))
+    if early_exit:
+        first_error = next(
+            (i for i, issue in enumerate(result.issues) if issue.severity == "error"), None
+        )
+        if first_error is not None:
+            del result.issues[first_error + 1:]
 
     # Recalculate summary
     result.summary = {}
@@ -251,26 +718,21 @@ if __name__ == "__main__":
     parser.add_argument("--types", nargs="+", help="Column:type (e.g., value:numeric)")
     parser.add_argument("--checks", nargs="+", default=["completeness", "type"],
                         choices=["completeness", "range", "type", "uniqueness", "ordering"])
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes for large inputs (default: 1)")
+    parser.add_argument("--chunksize", type=int, default=0,
+                        help="Rows per chunk when streaming large CSV input (default: 0, read it whole)")
+    parser.add_argument("--max-issues", type=int, default=1000,
+                        help="Completeness/ordering issues to report per column (default: 1000)")
+    parser.add_argument("--early-exit", action="store_true",
+                        help="Stop at the first error (pass/fail gating)")
 
     args = parser.parse_args()
 
-    data, _ = load_data(args.input)
-
-    # Parse column ranges
-    column_ranges = {}
-    if args.ranges:
-        for r in args.ranges:
-            parts = r.split(":")
-            if len(parts) == 3:
-                column_ranges[parts[0]] = (float(parts[1]), float(parts[2]))
+    data, _ = load_data(args.input, chunksize=args.chunksize)
 
-    # Parse column types
-    column_types = {}
-    if args.types:
-        for t in args.types:
-            parts = t.split(":")
-            if len(parts) == 2:
-                column_types[parts[0]] = parts[1]
+    column_ranges = dict(_parse_range_specs(tuple(args.ranges or ())))
+    column_types = dict(_parse_type_specs(tuple(args.types or ())))
 
     result = validate_for_viz(
         data=data,
@@ -278,12 +740,17 @@ if __name__ == "__main__":
         column_ranges=column_ranges,
         column_types=column_types,
         checks=args.checks,
+        num_workers=args.workers,
+        max_issues=args.max_issues,
+        early_exit=args.early_exit,
     )
 
     print(f"Valid: {result.is_valid}")
     print(f"Issues: {len(result.issues)}")
 
-    for issue in result.issues:
-        print(f"  [{issue.severity.upper()}] {issue.type}: {issue.message}")
+    # One write for all issues instead of a print call per line
+    sys.stdout.write("".join(
+        f"  [{issue.severity.upper()}] {issue.type}: {issue.message}\n" for issue in result.issues
+    ))
 
     sys.exit(0 if result.is_valid else 1)
@@ -4,7 +4,7 @@ List all tables in a PostgreSQL database.
 
 This script displays:
 - All tables in the public schema
-- Row counts for each table
+- Row counts for each table (planner estimates, or exact with --exact-count)
 - Table sizes
 
 Usage:
@@ -19,6 +19,7 @@ import sys
 
 try:
     import psycopg2
+    from psycopg2 import sql
 except ImportError:
     print("Error: psycopg2 not installed. Run: pip install psycopg2-binary")
     sys.exit(1)
@@ -26,6 +27,19 @@ except ImportError:
 
 def get_connection(args):
     """Create database connection from args or environment variables."""
+    # Go through a PgBouncer pool when configured, so repeated invocations
+    # reuse warm server connections instead of paying backend startup each time
+    pooler_url = os.environ.get('PGBOUNCER_URL')
+    if pooler_url:
+        overrides = {
+            'host': args.host,
+            'port': args.port,
+            'database': args.database,
+            'user': args.user,
+            'password': args.password,
+        }
+        return psycopg2.connect(pooler_url, **{k: v for k, v in overrides.items() if v})
+
     conn_params = {
         'host': args.host or os.environ.get('PGHOST', 'localhost'),
         'port': args.port or os.environ.get('PGPORT', '5432'),
@@ -78,18 +92,40 @@ def list_tables(args):
             if args.verbose:
                 print("\nDetailed table information:")
                 print("-" * 80)
-                for table in tables:
-                    # Get row count
-                    cur.execute(f"SELECT COUNT(*) FROM {table}")
-                    count = cur.fetchone()[0]
-
-                    # Get table size
-                    cur.execute("""
-                        SELECT pg_size_pretty(pg_total_relation_size(%s))
-                    """, (table,))
-                    size = cur.fetchone()[0]
 
-                    print(f"  {table}: {count:,} rows ({size})")
+                # Estimated row counts and sizes for every table in one round trip
+                cur.execute("""
+                    SELECT
+                        c.relname,
+                        c.reltuples::bigint,
+                        pg_size_pretty(pg_total_relation_size(c.oid))
+                    FROM pg_class c
+                    JOIN pg_namespace n ON n.oid = c.relnamespace
+                    WHERE n.nspname = 'public' AND c.relkind IN ('r', 'p')
+                    ORDER BY c.relname
+                """)
+                details = cur.fetchall()
+
+                exact_counts = {}
+                if args.exact_count and details:
+                    # Quote names so mixed-case and reserved-word tables count too,
+                    # and pin them to the public schema regardless of search_path
+                    cur.execute(sql.SQL(" UNION ALL ").join(
+                        sql.SQL("SELECT {}, COUNT(*) FROM {}").format(
+                            sql.Literal(table), sql.Identifier('public', table)
+                        )
+                        for table, _, _ in details
+                    ))
+                    exact_counts = dict(cur.fetchall())
+
+                for table, estimate, size in details:
+                    if table in exact_counts:
+                        rows = f"{exact_counts[table]:,}"
+                    elif estimate >= 0:
+                        rows = f"~{estimate:,}"
+                    else:
+                        rows = "unknown"  # Never vacuumed or analyzed
+                    print(f"  {table}: {rows} rows ({size})")
 
     except psycopg2.Error as e:
         print(f"Database error: {e}")
@@ -129,6 +165,11 @@ def main():
         action='store_true',
         help="Show detailed information including row counts"
     )
+    parser.add_argument(
+        '--exact-count',
+        action='store_true',
+        help="With --verbose, count rows exactly instead of using planner estimates"
+    )
 
     args = parser.parse_args()
     list_tables(args)
@@ -10,6 +10,7 @@ This script provides:
 Usage:
     python scripts/query_postgres.py --query "SELECT * FROM users LIMIT 10"
     python scripts/query_postgres.py --query "SELECT * FROM products WHERE price < %s" --params 100
+    python scripts/query_postgres.py --query "SELECT * FROM orders" --format csv --limit 0 > orders.csv
 
 Source: Derived from anthropics/skills PR #182 (Apache 2.0 License)
 """
@@ -25,9 +26,25 @@ except ImportError:
     print("Error: psycopg2 not installed. Run: pip install psycopg2-binary")
     sys.exit(1)
 
+# Statements that can run through a server-side (named) cursor
+STREAMABLE_STATEMENTS = ('SELECT', 'WITH', 'VALUES', 'TABLE')
+
 
 def get_connection(args):
     """Create database connection from args or environment variables."""
+    # Go through a PgBouncer pool when configured, so repeated invocations
+    # reuse warm server connections instead of paying backend startup each time
+    pooler_url = os.environ.get('PGBOUNCER_URL')
+    if pooler_url:
+        overrides = {
+            'host': args.host,
+            'port': args.port,
+            'database': args.database,
+            'user': args.user,
+            'password': args.password,
+        }
+        return psycopg2.connect(pooler_url, **{k: v for k, v in overrides.items() if v})
+
     conn_params = {
         'host': args.host or os.environ.get('PGHOST', 'localhost'),
         'port': args.port or os.environ.get('PGPORT', '5432'),
@@ -47,40 +64,78 @@ def get_connection(args):
     return psycopg2.connect(**conn_params)
 
 
+def export_csv(conn, query, params, limit):
+    """Stream query results to stdout as CSV via COPY, formatted server-side."""
+    with conn.cursor() as cur:
+        # COPY takes no bind parameters, so inline them client-side
+        body = cur.mogrify(query.strip().rstrip(';'), params).decode()
+        if limit:
+            inner = sql.SQL("SELECT * FROM ({}) AS _q LIMIT {}").format(sql.SQL(body), sql.Literal(limit))
+        else:
+            inner = sql.SQL(body)
+        sys.stdout.flush()
+        cur.copy_expert(sql.SQL("COPY ({}) TO STDOUT WITH CSV HEADER").format(inner), sys.stdout.buffer)
+        sys.stdout.buffer.flush()
+
+
 def execute_query(args):
     """Execute a read-only SQL query."""
     conn = None
     try:
         conn = get_connection(args)
+        if not args.allow_write:
+            # Enforce read-only on the server, not just via the keyword check
+            conn.set_session(readonly=True)
+
+        # Parse parameters if provided
+        params = None
+        if args.params:
+            params = tuple(args.params.split(','))
+
+        # A named cursor keeps the result set on the server so only the
+        # displayed rows are transferred, however large the result is
+        words = args.query.split(None, 1)
+        streamable = not args.allow_write and bool(words) and words[0].upper() in STREAMABLE_STATEMENTS
 
-        with conn.cursor() as cur:
-            # Parse parameters if provided
-            params = None
-            if args.params:
-                params = tuple(args.params.split(','))
+        if args.format == 'csv':
+            if not streamable:
+                print("Error: --format csv only supports read-only SELECT/WITH/VALUES/TABLE queries.")
+                sys.exit(1)
+            export_csv(conn, args.query, params, args.limit)
+            return
 
+        limit = args.limit or 100
+
+        with conn.cursor(name="qp_stream" if streamable else None) as cur:
             # Execute with parameterized query (SQL injection protection)
             if params:
                 cur.execute(args.query, params)
             else:
                 cur.execute(args.query)
 
-            # Fetch results
+            # Fetch one row past the limit to know whether output is truncated
+            rows = cur.fetchmany(limit + 1)
             columns = [desc[0] for desc in cur.description]
-            rows = cur.fetchall()
 
             # Print column headers
             print(",".join(columns))
             print("-" * (len(",".join(columns)) + len(columns) * 2))
 
-            # Print rows with limit
-            limit = args.limit or 100
-            for i, row in enumerate(rows):
-                if i >= limit:
-                    print(f"\n... (showing first {limit} rows)")
-                    break
-                print(",".join(str(cell) for cell in row))
-
+            # Print rows with limit, formatted up front and written in one call
+            sys.stdout.write("".join(",".join(map(str, row)) + "\n" for row in rows[:limit]))
+            if len(rows) > limit:
+                print(f"\n... (showing first {limit} rows)")
+
+        if args.count:
+            with conn.cursor() as cur:
+                count_query = sql.SQL("SELECT COUNT(*) FROM ({}) AS _q").format(
+                    sql.SQL(args.query.strip().rstrip(';'))
+                )
+                cur.execute(count_query, params)
+                print(f"\nTotal rows: {cur.fetchone()[0]}")
+        elif len(rows) > limit:
+            print(f"\nTotal rows: more than {limit} (use --count for the exact total)")
+        else:
             print(f"\nTotal rows: {len(rows)}")
 
     except psycopg2.Error as e:
@@ -129,7 +184,18 @@ def main():
         '--limit', '-l',
         type=int,
         default=100,
-        help="Maximum rows to display (default: 100)"
+        help="Maximum rows to display (default: 100; 0 exports all rows with --format csv)"
+    )
+    parser.add_argument(
+        '--format', '-f',
+        choices=['table', 'csv'],
+        default='table',
+        help="Output format; csv streams raw COPY output with a header row (default: table)"
+    )
+    parser.add_argument(
+        '--count',
+        action='store_true',
+        help="Also run COUNT(*) over the query to report the exact total rows"
     )
     parser.add_argument(
         '--allow-write',
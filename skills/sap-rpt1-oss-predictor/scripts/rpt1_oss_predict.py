@@ -8,11 +8,17 @@ predictions using the SAP RPT-1-OSS model.
 Usage:
     python scripts/rpt1_oss_predict.py --task classification --data data.csv --target CHURN_STATUS
     python scripts/rpt1_oss_predict.py --task regression --data data.csv --target DELAY_DAYS
+    python scripts/rpt1_oss_predict.py --task classification --data data.csv --target CHURN_STATUS --jobs 4
+    python scripts/rpt1_oss_predict.py --task regression --data data.csv --target DELAY_DAYS --cache-dir ~/.cache/rpt1
 
 Source: Derived from anthropics/skills PR #181 (Apache 2.0 License)
 """
 
 import argparse
+import hashlib
+import json
+import os
+import numpy as np
 import pandas as pd
 import sys
 
@@ -24,10 +30,23 @@ except ImportError:
     sys.exit(1)
 
 
-def load_data(data_path):
-    """Load CSV data."""
+def load_data(data_path, chunksize=None, dtypes=None):
+    """Load CSV data.
+
+    With chunksize, the file is parsed that many rows at a time, which keeps
+    the parser's working memory bounded on large inputs. Types are inferred
+    per chunk, so a column that is numeric early and text later comes back
+    as mixed int/str values instead of all str; pin such columns with
+    dtypes, which is passed to read_csv so they need no inference.
+    """
     try:
-        df = pd.read_csv(data_path)
+        if chunksize:
+            reader = pd.read_csv(data_path, chunksize=chunksize, dtype=dtypes,
+                                 engine="c", low_memory=False)
+            with reader:
+                df = pd.concat(reader, ignore_index=True)
+        else:
+            df = pd.read_csv(data_path, dtype=dtypes)
         print(f"Loaded {len(df)} rows from {data_path}")
         return df
     except Exception as e:
@@ -35,62 +54,182 @@ def load_data(data_path):
         sys.exit(1)
 
 
-def run_classification(data_path, target_column, output_path=None, max_context=4096, bagging=4):
+def _predict_bag(model_cls, max_context, X_train, y_train, X_test, seed, proba):
+    """Fit a single-bag model on a bootstrap replicate and predict X_test.
+
+    Returns (classes, probabilities) when proba is set, else predictions.
+    Module-level so joblib can send it to worker processes.
+    """
+    idx = np.random.RandomState(seed).choice(len(X_train), len(X_train), replace=True)
+    model = model_cls(max_context_size=max_context, bagging=1)
+    model.fit(X_train.iloc[idx], y_train.iloc[idx])
+    if proba:
+        return model.classes_, model.predict_proba(X_test)
+    return model.predict(X_test)
+
+
+def _parallel_bags(model_cls, max_context, bagging, n_jobs, X_train, y_train, X_test, proba):
+    """Run each bagging replicate as an independent joblib task.
+
+    Returns the per-bag results of _predict_bag, or None when joblib is
+    unavailable so the caller can fall back to the model's own bagging.
+    """
+    try:
+        from joblib import Parallel, delayed
+    except ImportError:
+        print("Warning: joblib not installed, using the model's built-in bagging")
+        return None
+
+    return Parallel(n_jobs=min(bagging, n_jobs), backend="loky")(
+        delayed(_predict_bag)(model_cls, max_context, X_train, y_train, X_test, seed, proba)
+        for seed in range(bagging)
+    )
+
+
+def _fit_model(model_cls, X_train, y_train, max_context, bagging, cache_dir=None):
+    """Fit a model, reusing one saved under cache_dir for identical inputs.
+
+    The cache key hashes the training rows, column names, model class and
+    settings, so a repeat run on the same data loads instead of refitting.
+    """
+    model = None
+    path = None
+    if cache_dir:
+        try:
+            import joblib
+        except ImportError:
+            print("Warning: joblib not installed, fitting without cache")
+            joblib = None
+
+        if joblib is not None:
+            key = hashlib.blake2b(digest_size=8)
+            key.update(f"{model_cls.__name__}:{max_context}:{bagging}:".encode())
+            key.update("\0".join(map(str, X_train.columns)).encode())
+            key.update(pd.util.hash_pandas_object(X_train, index=False).to_numpy().tobytes())
+            key.update(pd.util.hash_pandas_object(y_train, index=False).to_numpy().tobytes())
+            path = os.path.join(os.path.expanduser(cache_dir), f"{key.hexdigest()}.joblib")
+
+            if os.path.exists(path):
+                # mmap_mode maps large array members instead of reading them in
+                model = joblib.load(path, mmap_mode="r")
+                print(f"Loaded fitted model from {path}")
+
+    if model is None:
+        model = model_cls(max_context_size=max_context, bagging=bagging)
+        model.fit(X_train, y_train)
+        if path:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            joblib.dump(model, path, compress=0)
+            print(f"Saved fitted model to {path}")
+
+    return model
+
+
+def _write_results(results_df, output_path, engine="pandas"):
+    """Write prediction results to CSV.
+
+    The pyarrow engine formats whole columns in C, which is much faster for
+    large outputs; it quotes every string field, so the file differs
+    textually from the pandas engine's. Falls back to pandas without pyarrow.
+    """
+    if engine == "pyarrow":
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+        except ImportError:
+            print("Warning: pyarrow not installed, writing with pandas")
+        else:
+            table = pa.Table.from_pandas(results_df, preserve_index=False)
+            pacsv.write_csv(table, output_path, pacsv.WriteOptions(batch_size=2 ** 16))
+            return
+
+    # Write in 64k-row batches rather than formatting the whole file in memory
+    results_df.to_csv(output_path, index=False, chunksize=2 ** 16)
+
+
+def run_classification(data_path, target_column, output_path=None, max_context=4096, bagging=4, n_jobs=1,
+        chunksize=None, cache_dir=None, csv_engine="pandas", dtypes=None):
     """Run classification prediction."""
-    df = load_data(data_path)
+    df = load_data(data_path, chunksize=chunksize, dtypes=dtypes)
 
-    X = df.drop(columns=[target_column])
-    y = df[target_column]
+    # pop moves the target out in place rather than copying every feature column
+    y = df.pop(target_column)
+    X = df
 
-    # Simple train/test split
+    # Simple train/test split; positional iloc slices are views, and the model
+    # gets DataFrames because RPT-1 reads the column names as context
     split_idx = int(len(df) * 0.8)
     X_train, X_test = X.iloc[:split_idx], X.iloc[split_idx:]
     y_train, y_test = y.iloc[:split_idx], y.iloc[split_idx:]
 
     print(f"Training on {len(X_train)} samples, testing on {len(X_test)} samples")
 
-    # Initialize and fit model
-    model = SAP_RPT_OSS_Classifier(max_context_size=max_context, bagging=bagging)
-    model.fit(X_train, y_train)
+    bags = None
+    if n_jobs > 1 and bagging > 1:
+        bags = _parallel_bags(SAP_RPT_OSS_Classifier, max_context, bagging, n_jobs,
+                              X_train, y_train, X_test, proba=True)
+
+    if bags is not None:
+        # Average probabilities over bags, aligning each bag's columns to all
+        # training classes since a bootstrap sample can miss a rare class
+        classes = np.unique(y_train)
+        probabilities = np.zeros((len(X_test), len(classes)))
+        for bag_classes, bag_proba in bags:
+            probabilities[:, np.searchsorted(classes, bag_classes)] += bag_proba
+        probabilities /= len(bags)
+        predictions = classes[probabilities.argmax(axis=1)]
+    else:
+        # Initialize and fit model, or load a cached fit
+        model = _fit_model(SAP_RPT_OSS_Classifier, X_train, y_train, max_context, bagging, cache_dir)
 
-    # Predict
-    predictions = model.predict(X_test)
-    probabilities = model.predict_proba(X_test)
+        # Predict
+        predictions = model.predict(X_test)
+        probabilities = model.predict_proba(X_test)
+        classes = model.classes_
 
     # Print results
     print(f"\nPredictions: {len(predictions)}")
-    print(f"Unique classes: {list(model.classes_)}")
+    print(f"Unique classes: {list(classes)}")
 
     if output_path:
-        results_df = X_test.copy()
-        results_df['actual'] = y_test
-        results_df['predicted'] = predictions
-        results_df.to_csv(output_path, index=False)
+        # One copy of the test rows with both result columns, not copy-then-insert twice
+        results_df = X_test.assign(actual=y_test, predicted=predictions)
+        _write_results(results_df, output_path, csv_engine)
         print(f"Results saved to {output_path}")
 
     return predictions
 
 
-def run_regression(data_path, target_column, output_path=None, max_context=4096, bagging=4):
+def run_regression(data_path, target_column, output_path=None, max_context=4096, bagging=4, n_jobs=1,
+        chunksize=None, cache_dir=None, csv_engine="pandas", dtypes=None):
     """Run regression prediction."""
-    df = load_data(data_path)
+    df = load_data(data_path, chunksize=chunksize, dtypes=dtypes)
 
-    X = df.drop(columns=[target_column])
-    y = df[target_column]
+    # pop moves the target out in place rather than copying every feature column
+    y = df.pop(target_column)
+    X = df
 
-    # Simple train/test split
+    # Simple train/test split; positional iloc slices are views, and the model
+    # gets DataFrames because RPT-1 reads the column names as context
     split_idx = int(len(df) * 0.8)
     X_train, X_test = X.iloc[:split_idx], X.iloc[split_idx:]
     y_train, y_test = y.iloc[:split_idx], y.iloc[split_idx:]
 
     print(f"Training on {len(X_train)} samples, testing on {len(X_test)} samples")
 
-    # Initialize and fit model
-    model = SAP_RPT_OSS_Regressor(max_context_size=max_context, bagging=bagging)
-    model.fit(X_train, y_train)
+    bags = None
+    if n_jobs > 1 and bagging > 1:
+        bags = _parallel_bags(SAP_RPT_OSS_Regressor, max_context, bagging, n_jobs,
+                              X_train, y_train, X_test, proba=False)
 
-    # Predict
-    predictions = model.predict(X_test)
+    if bags is not None:
+        predictions = np.mean(bags, axis=0)
+    else:
+        # Initialize and fit model, or load a cached fit
+        model = _fit_model(SAP_RPT_OSS_Regressor, X_train, y_train, max_context, bagging, cache_dir)
+
+        # Predict
+        predictions = model.predict(X_test)
 
     # Print results
     print(f"\nPredictions: {len(predictions)}")
@@ -98,10 +237,9 @@ def run_regression(data_path, target_column, output_path=None, max_context=4096,
     print(f"Std prediction: {predictions.std():.2f}")
 
     if output_path:
-        results_df = X_test.copy()
-        results_df['actual'] = y_test
-        results_df['predicted'] = predictions
-        results_df.to_csv(output_path, index=False)
+        # One copy of the test rows with both result columns, not copy-then-insert twice
+        results_df = X_test.assign(actual=y_test, predicted=predictions)
+        _write_results(results_df, output_path, csv_engine)
         print(f"Results saved to {output_path}")
 
     return predictions
@@ -143,6 +281,42 @@ def main():
         default=4,
         help="Number of bagging iterations (default: 4)"
     )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        help="Fit bagging iterations in this many parallel processes (default: 1, "
+             "the model's built-in sequential bagging)"
+    )
+
+    parser.add_argument(
+        '--chunksize',
+        type=int,
+        default=0,
+        help="Rows parsed per chunk when reading the CSV, bounding parser memory "
+             "(default: 0, read at once). Column types are inferred per chunk; "
+             "use --dtypes to pin columns that mix numbers and text"
+    )
+
+    parser.add_argument(
+        '--dtypes',
+        type=json.loads,
+        help='JSON mapping of column to pandas dtype for reading the CSV, '
+             'e.g. \'{"ZIP": "str", "AMOUNT": "float64"}\''
+    )
+
+    parser.add_argument(
+        '--cache-dir',
+        help="Save fitted models here and reuse them when the training data and "
+             "settings match (e.g. ~/.cache/rpt1; default: no caching)"
+    )
+
+    parser.add_argument(
+        '--csv-engine',
+        choices=['pandas', 'pyarrow'],
+        default='pandas',
+        help="Writer for --output; pyarrow is faster on large outputs (default: pandas)"
+    )
 
     args = parser.parse_args()
 
@@ -151,14 +325,24 @@ def main():
             args.data, args.target,
             output_path=args.output,
             max_context=args.max_context,
-            bagging=args.bagging
+            bagging=args.bagging,
+            n_jobs=args.jobs,
+            chunksize=args.chunksize,
+            dtypes=args.dtypes,
+            cache_dir=args.cache_dir,
+            csv_engine=args.csv_engine
         )
     else:
         run_regression(
             args.data, args.target,
             output_path=args.output,
             max_context=args.max_context,
-            bagging=args.bagging
+            bagging=args.bagging,
+            n_jobs=args.jobs,
+            chunksize=args.chunksize,
+            dtypes=args.dtypes,
+            cache_dir=args.cache_dir,
+            csv_engine=args.csv_engine
         )
 
 
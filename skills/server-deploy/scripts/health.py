@@ -13,11 +13,50 @@ import os
 import shutil
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
-
-
-@dataclass
+from typing import Dict, List, Optional, Tuple
+
+# Imported once up front; checks branch on the flag instead of retrying the import
+try:
+    import psutil
+    _HAS_PSUTIL = True
+except ImportError:
+    psutil = None
+    _HAS_PSUTIL = False
+
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        """Serialize to indented JSON with orjson's native encoder."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    def _dumps(obj) -> str:
+        """Serialize to indented JSON."""
+        return json.dumps(obj, indent=2)
+
+# Last /proc/stat (time, idle, total) sample, persisted so a fresh process
+# run shortly after the previous one can compute usage against it instead of
+# sleeping to sample twice. Kept in a per-user directory, never a shared temp
+# path, and named by uid so runs under sudo with an inherited HOME do not
+# clobber the user's file.
+_CPU_SAMPLE_DIR = os.environ.get("XDG_RUNTIME_DIR") or os.path.join(os.path.expanduser("~"), ".cache")
+_CPU_SAMPLE_FILE = os.path.join(_CPU_SAMPLE_DIR, f"health_cpu.{os.getuid()}")
+_CPU_PREV: Optional[Tuple[float, int, int]] = None
+
+# Samples older than this no longer reflect current load and are ignored
+CPU_SAMPLE_MAX_AGE = 5.0
+# Seconds between the two reads when no recent sample is available
+CPU_SAMPLE_INTERVAL = 0.5
+
+# Overall status precedence: critical > warning > unknown > healthy
+_STATUSES_BY_RANK = ("healthy", "unknown", "warning", "critical")
+_STATUS_RANK = {status: rank for rank, status in enumerate(_STATUSES_BY_RANK)}
+
+
+@dataclass(slots=True)
 class HealthCheckResult:
     """Result of a health check."""
     name: str
@@ -27,7 +66,7 @@ class HealthCheckResult:
     threshold: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthReport:
     """Overall health report."""
     checks: List[HealthCheckResult] = field(default_factory=list)
@@ -66,8 +105,13 @@ class HealthChecker:
         "disk_critical": 95,
     }
 
+    # Seconds a disk usage reading is reused for the same path
+    DISK_CACHE_TTL = 1.0
+
     def __init__(self, custom_thresholds: Dict[str, int] = None):
         self.thresholds = {**self.THRESHOLDS, **(custom_thresholds or {})}
+        # path -> (monotonic time, shutil.disk_usage result)
+        self._disk_cache: Dict[str, Tuple[float, tuple]] = {}
 
     def check_cpu(self) -> HealthCheckResult:
         """Check CPU usage."""
@@ -109,28 +153,97 @@ class HealthChecker:
             )
 
     def _get_cpu_usage(self) -> Optional[float]:
-        """Get CPU usage percentage."""
+        """Get CPU usage percentage.
+
+        Computed from the change in /proc/stat counters since the previous
+        sample (this process's or the last run's) when that sample is under
+        CPU_SAMPLE_MAX_AGE seconds old, else from two reads; either way the
+        window spans at least CPU_SAMPLE_INTERVAL seconds.
+        """
+        global _CPU_PREV
+
+        now = time.time()
+        sample = self._read_cpu_times()
+        if sample is None:
+            # No /proc (not Linux): let psutil sample over a second
+            if _HAS_PSUTIL:
+                return psutil.cpu_percent(interval=1)
+            return None
+
+        prev = _CPU_PREV or self._load_cpu_sample()
+        if prev is None or not 0 <= now - prev[0] <= CPU_SAMPLE_MAX_AGE or sample[1] < prev[2]:
+            prev = (now, *sample)
+        # Too short a window mostly measures this process starting up
+        wait = CPU_SAMPLE_INTERVAL - (now - prev[0])
+        if wait > 0:
+            time.sleep(wait)
+            now = time.time()
+            sample = self._read_cpu_times()
+            if sample is None:
+                return None
+
+        _CPU_PREV = (now, *sample)
+        self._save_cpu_sample(_CPU_PREV)
+
+        idle, total = sample[0] - prev[1], sample[1] - prev[2]
+        if total <= 0:
+            return None
+        return round(100 - (idle / total * 100), 1)
+
+    def _read_cpu_times(self) -> Optional[Tuple[int, int]]:
+        """Read aggregate (idle, total) jiffies from /proc/stat."""
         try:
-            import psutil
-            return psutil.cpu_percent(interval=1)
-        except ImportError:
-            pass
+            # One unbuffered read; the aggregate "cpu" line is at the start
+            fd = os.open("/proc/stat", os.O_RDONLY)
+            try:
+                head = os.read(fd, 4096)
+            finally:
+                os.close(fd)
+            fields = [int(x) for x in head.split(b"\n", 1)[0].split()[1:9]]
+        except (OSError, ValueError):
+            return None
+        # user nice system idle iowait irq softirq steal; iowait counts as idle
+        return fields[3] + fields[4], sum(fields)
 
-        # Fallback: parse /proc/stat
+    def _load_cpu_sample(self) -> Optional[Tuple[float, int, int]]:
+        """Load the sample saved by a previous run, if any."""
         try:
-            with open("/proc/stat", "r") as f:
-                line = f.readline()
-            idle = int(line.split()[4])
-            total = sum(int(x) for x in line.split()[1:5])
-            usage = 100 - (idle / total * 100)
-            return round(usage, 1)
-        except:
+            fd = os.open(_CPU_SAMPLE_FILE, os.O_RDONLY | os.O_NOFOLLOW)
+            try:
+                taken, idle, total = os.read(fd, 96).split()
+            finally:
+                os.close(fd)
+            return float(taken), int(idle), int(total)
+        except (OSError, ValueError):
             return None
 
+    def _save_cpu_sample(self, sample: Tuple[float, int, int]):
+        """Persist a sample for the next run; failures are harmless."""
+        # Write a fresh private file, refusing to follow or reuse anything
+        # already at the temp path, then atomically rename it into place
+        tmp = f"{_CPU_SAMPLE_FILE}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(_CPU_SAMPLE_DIR, mode=0o700, exist_ok=True)
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_NOFOLLOW, 0o600)
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(f"{sample[0]} {sample[1]} {sample[2]}")
+            os.replace(tmp, _CPU_SAMPLE_FILE)
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
     def check_memory(self) -> HealthCheckResult:
         """Check memory usage."""
+        if not _HAS_PSUTIL:
+            return HealthCheckResult(
+                name="memory", status="unknown", message="psutil not installed"
+            )
         try:
-            import psutil
             mem = psutil.virtual_memory()
             usage = mem.percent
 
@@ -158,19 +271,19 @@ class HealthChecker:
                     value=f"{usage}%",
                     threshold=f">{self.thresholds['memory_critical']}%",
                 )
-        except ImportError:
-            return HealthCheckResult(
-                name="memory", status="unknown", message="psutil not installed"
-            )
         except Exception as e:
             return HealthCheckResult(
                 name="memory", status="unknown", message=f"Error: {str(e)}"
             )
 
-    def check_disk(self, path: str = "/") -> HealthCheckResult:
-        """Check disk usage."""
+    def check_disk(self, path: str = "/", ttl: Optional[float] = None) -> HealthCheckResult:
+        """Check disk usage.
+
+        Readings are reused for ttl seconds (DISK_CACHE_TTL by default) so
+        fast polling loops don't statvfs on every call; ttl=0 always reads.
+        """
         try:
-            usage = shutil.disk_usage(path)
+            usage = self._disk_usage(path, self.DISK_CACHE_TTL if ttl is None else ttl)
             percent = (usage.used / usage.total) * 100
 
             if percent < self.thresholds["disk_warning"]:
@@ -202,17 +315,55 @@ class HealthChecker:
                 name="disk", status="unknown", message=f"Error: {str(e)}"
             )
 
+    def _process_running(self, name: str) -> Optional[bool]:
+        """Check for a process by exact name via /proc, or None without /proc."""
+        target = name.encode() + b"\n"  # comm as the kernel reports it
+        try:
+            proc_dir = os.scandir("/proc")
+        except FileNotFoundError:
+            return None
+
+        with proc_dir:
+            for entry in proc_dir:
+                if not entry.name.isdigit():
+                    continue
+                try:
+                    fd = os.open(f"{entry.path}/comm", os.O_RDONLY)
+                    try:
+                        comm = os.read(fd, 64)
+                    finally:
+                        os.close(fd)
+                except OSError:
+                    continue  # Process exited or is not readable
+                if comm == target:
+                    return True
+        return False
+
+    def _disk_usage(self, path: str, ttl: float) -> tuple:
+        """shutil.disk_usage(path), served from the per-path cache when fresh."""
+        now = time.monotonic()
+        cached = self._disk_cache.get(path)
+        if ttl > 0 and cached is not None and now - cached[0] < ttl:
+            return cached[1]
+        usage = shutil.disk_usage(path)
+        self._disk_cache[path] = (now, usage)
+        return usage
+
     def check_caddy(self) -> HealthCheckResult:
         """Check Caddy web server status."""
         try:
-            # Check if caddy process is running
-            result = subprocess.run(
-                ["pgrep", "-x", "caddy"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode == 0:
+            # Check if caddy process is running, reading /proc directly so no
+            # child process is spawned; pgrep is the fallback off Linux
+            running = self._process_running("caddy")
+            if running is None:
+                result = subprocess.run(
+                    ["pgrep", "-x", "caddy"],
+                    capture_output=True,
+                    text=True,
+                    timeout=5,
+                )
+                running = result.returncode == 0
+            if running:
                 return HealthCheckResult(
                     name="caddy",
                     status="healthy",
@@ -275,21 +426,17 @@ class HealthChecker:
         report = HealthReport()
         report.timestamp = datetime.now().isoformat()
 
-        report.add_check(self.check_cpu())
-        report.add_check(self.check_memory())
-        report.add_check(self.check_disk())
-        report.add_check(self.check_caddy())
-
-        # Determine overall status
-        statuses = [c.status for c in report.checks]
-        if "critical" in statuses:
-            report.overall_status = "critical"
-        elif "warning" in statuses:
-            report.overall_status = "warning"
-        elif all(s == "healthy" for s in statuses):
-            report.overall_status = "healthy"
-        else:
-            report.overall_status = "unknown"
+        # The checks are independent and mostly wait on IO or psutil sampling,
+        # so run them together; map keeps the report in this order
+        checks = (self.check_cpu, self.check_memory, self.check_disk, self.check_caddy)
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            for check in executor.map(lambda fn: fn(), checks):
+                report.add_check(check)
+
+        # Determine overall status: the most severe check wins, in one pass;
+        # any status other than healthy/warning/critical ranks as unknown
+        worst = max((_STATUS_RANK.get(c.status, 1) for c in report.checks), default=0)
+        report.overall_status = _STATUSES_BY_RANK[worst]
 
         return report
 
@@ -297,7 +444,7 @@ class HealthChecker:
 def format_report(report: HealthReport, format_type: str = "text") -> str:
     """Format health report for display."""
     if format_type == "json":
-        return json.dumps(report.to_dict(), indent=2)
+        return _dumps(report.to_dict())
 
     lines = ["=== System Health Check ===", ""]
 
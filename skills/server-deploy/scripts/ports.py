@@ -8,15 +8,42 @@ Map and manage port allocations.
 """
 
 import argparse
+import errno
 import json
 import os
 import re
+import selectors
+import socket
 import subprocess
+import time
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
+try:
+    # Keeps port maps in key order as they are built, so renders need no sort
+    from sortedcontainers import SortedDict
+except ImportError:
+    SortedDict = None
 
-@dataclass
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        """Serialize to indented JSON with orjson's native encoder."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    def _dumps(obj) -> str:
+        """Serialize to indented JSON."""
+        return json.dumps(obj, indent=2)
+
+# Socket state code for LISTEN in /proc/net/tcp and /proc/net/tcp6
+_TCP_LISTEN = b"0A"
+
+# Owning pid in an ss -p users:((...)) column
+_PID_RE = re.compile(r"pid=(\d+)")
+
+
+@dataclass(slots=True)
 class PortInfo:
     """Information about a port."""
     port: int
@@ -27,11 +54,11 @@ class PortInfo:
     reserved: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class PortMap:
     """Port allocation map."""
-    ports: Dict[int, PortInfo] = field(default_factory=dict)
-    reservations: Dict[int, str] = field(default_factory=dict)
+    ports: Dict[int, PortInfo] = field(default_factory=SortedDict or dict)
+    reservations: Dict[int, str] = field(default_factory=SortedDict or dict)
 
     def add_port(self, port: PortInfo):
         self.ports[port.port] = port
@@ -63,14 +90,24 @@ class PortManager:
         27017: "MongoDB",
     }
 
+    # Ports probed concurrently per batch, well under the usual open-file limit
+    PROBE_BATCH = 512
+
+    # Seconds a scan_ports() result is reused by find_process
+    SCAN_TTL = 1.0
+
     def __init__(self):
         self.port_map = PortMap()
+        self._scan_cache: Optional[Tuple[float, Dict[int, PortInfo]]] = None
 
     def scan_ports(self, start: int = 1, end: int = 65535) -> List[PortInfo]:
         """Scan for active ports."""
-        ports = []
+        # Read the kernel socket tables directly; no child process needed
+        ports = self._scan_proc_net()
+        if ports is not None:
+            return ports
 
-        # Try to get from ss or netstat
+        # No /proc (not Linux): try to get from ss or netstat
         try:
             result = subprocess.run(
                 ["ss", "-tlnp"],
@@ -94,6 +131,80 @@ class PortManager:
 
         return ports
 
+    def _scan_proc_net(self) -> Optional[List[PortInfo]]:
+        """Read listening TCP sockets from /proc/net, or None without /proc."""
+        listening = []  # (inode, port)
+        readable = False
+        for table in ("/proc/net/tcp", "/proc/net/tcp6"):
+            try:
+                with open(table, "rb") as f:
+                    data = f.read()
+                readable = True
+            except FileNotFoundError:
+                continue  # e.g. IPv6 disabled
+
+            # Parse raw bytes, skipping most lines with one substring test:
+            # " 0A " can only be the state column, as the other fields are
+            # joined hex pairs or decimal
+            for line in data.splitlines()[1:]:
+                if b" 0A " not in line:
+                    continue
+                # sl, local_address, rem_address, st, ..., inode
+                parts = line.split(None, 10)
+                if len(parts) >= 10 and parts[3] == _TCP_LISTEN:
+                    port = int(parts[1].rpartition(b":")[2], 16)
+                    listening.append((parts[9].decode(), port))
+
+        if not readable:
+            return None
+
+        owners = self._socket_owners({inode for inode, _ in listening})
+        ports = []
+        for inode, port in listening:
+            pid, proc = owners.get(inode, (None, None))
+            ports.append(PortInfo(port=port, protocol="tcp", process=proc, pid=pid))
+        return ports
+
+    def _socket_owners(self, inodes: Set[str]) -> Dict[str, Tuple[int, Optional[str]]]:
+        """Map socket inodes to (pid, process name) by walking /proc/<pid>/fd.
+
+        Like ss -p, only processes we may inspect are found; other sockets
+        are left without an owner.
+        """
+        owners = {}
+        if not inodes:
+            return owners
+        targets = {f"socket:[{inode}]": inode for inode in inodes}
+
+        with os.scandir("/proc") as proc_dir:
+            for entry in proc_dir:
+                if not entry.name.isdigit():
+                    continue
+                matched = []
+                try:
+                    with os.scandir(f"{entry.path}/fd") as fd_dir:
+                        for fd in fd_dir:
+                            try:
+                                link = os.readlink(fd.path)
+                            except OSError:
+                                continue  # Descriptor closed while scanning
+                            if link in targets:
+                                matched.append(targets[link])
+                except OSError:
+                    continue  # Process exited or permission denied
+                if not matched:
+                    continue
+                try:
+                    with open(f"{entry.path}/comm", "r") as f:
+                        proc = f.read().strip()
+                except OSError:
+                    proc = None
+                for inode in matched:
+                    owners[inode] = (int(entry.name), proc)
+                if len(owners) == len(inodes):
+                    break
+        return owners
+
     def _parse_ss_output(self, output: str) -> List[PortInfo]:
         """Parse ss command output."""
         ports = []
@@ -102,16 +213,15 @@ class PortManager:
                 parts = line.split()
                 if len(parts) >= 5:
                     # Parse local address
-                    addr = parts[3]
-                    match = re.match(r"(.+):(\d+)", addr)
-                    if match:
-                        port = int(match.group(2))
+                    _, _, port_str = parts[3].rpartition(":")
+                    if port_str.isdigit():
+                        port = int(port_str)
                         # Get process info
                         proc = None
                         pid = None
                         for part in parts[4:]:
                             if "pid=" in part:
-                                pid_match = re.search(r"pid=(\d+)", part)
+                                pid_match = _PID_RE.search(part)
                                 if pid_match:
                                     pid = int(pid_match.group(1))
                                 proc = part.split("=")[-1] if "=" in part else part
@@ -132,10 +242,9 @@ class PortManager:
             if "LISTEN" in line:
                 parts = line.split()
                 if len(parts) >= 4:
-                    addr = parts[3]
-                    match = re.match(r"(.+):(\d+)", addr)
-                    if match:
-                        port = int(match.group(2))
+                    _, _, port_str = parts[3].rpartition(":")
+                    if port_str.isdigit():
+                        port = int(port_str)
                         protocol = "tcp" if "tcp" in line.lower() else "udp"
                         ports.append(PortInfo(port=port, protocol=protocol))
         return ports
@@ -143,8 +252,9 @@ class PortManager:
     def _scan_common_ports(self) -> List[PortInfo]:
         """Scan common ports manually."""
         ports = []
+        in_use = self._probe_ports(self.COMMON_PORTS)
         for port, service in self.COMMON_PORTS.items():
-            if self._check_port(port):
+            if port in in_use:
                 ports.append(
                     PortInfo(
                         port=port,
@@ -155,18 +265,48 @@ class PortManager:
                 )
         return ports
 
+    def _probe_ports(self, ports: Iterable[int], timeout: float = 1.0) -> Set[int]:
+        """Return the localhost ports that accept a TCP connection.
+
+        Connects are issued non-blocking a batch at a time and awaited
+        together, so each batch waits at most one timeout, not one per port.
+        """
+        ports = list(ports)
+        in_use = set()
+        for start in range(0, len(ports), self.PROBE_BATCH):
+            socks = []
+            with selectors.DefaultSelector() as selector:
+                try:
+                    for port in ports[start:start + self.PROBE_BATCH]:
+                        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                        socks.append(sock)
+                        sock.setblocking(False)
+                        result = sock.connect_ex(("127.0.0.1", port))
+                        if result == 0:
+                            in_use.add(port)
+                        elif result == errno.EINPROGRESS:
+                            selector.register(sock, selectors.EVENT_WRITE, port)
+
+                    deadline = time.monotonic() + timeout
+                    while selector.get_map():
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break  # Still pending ports count as free, as on timeout before
+                        for key, _ in selector.select(remaining):
+                            selector.unregister(key.fileobj)
+                            if key.fileobj.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                                in_use.add(key.data)
+                finally:
+                    for sock in socks:
+                        sock.close()
+        return in_use
+
     def _check_port(self, port: int) -> bool:
         """Check if a port is in use."""
-        import socket
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(1)
         try:
-            result = sock.connect_ex(("localhost", port))
-            return result == 0
-        except:
+            return port in self._probe_ports([port])
+        except OSError:
             return False
-        finally:
-            sock.close()
 
     def check_port(self, port: int) -> PortInfo:
         """Check if a specific port is available."""
@@ -180,21 +320,27 @@ class PortManager:
     def find_available(self, start: int = 8000, end: int = 9000, count: int = 1) -> List[int]:
         """Find available ports in a range."""
         available = []
-        for port in range(start, end + 1):
-            if port in self.SKIP_PORTS:
-                continue
-            if not self._check_port(port):
-                available.append(port)
-                if len(available) >= count:
-                    break
-        return available
+        candidates = [port for port in range(start, end + 1) if port not in self.SKIP_PORTS]
+        for batch_start in range(0, len(candidates), self.PROBE_BATCH):
+            batch = candidates[batch_start:batch_start + self.PROBE_BATCH]
+            in_use = self._probe_ports(batch)
+            available.extend(port for port in batch if port not in in_use)
+            if len(available) >= count:
+                break
+        return available[:count]
 
     def find_process(self, port: int) -> Optional[PortInfo]:
-        """Find process using a port."""
-        for p in self.scan_ports():
-            if p.port == port:
-                return p
-        return None
+        """Find process using a port.
+
+        Lookups within SCAN_TTL seconds of each other share one scan.
+        """
+        now = time.monotonic()
+        if self._scan_cache is None or now - self._scan_cache[0] >= self.SCAN_TTL:
+            by_port: Dict[int, PortInfo] = {}
+            for p in self.scan_ports():
+                by_port.setdefault(p.port, p)  # First socket wins, as in a linear scan
+            self._scan_cache = (now, by_port)
+        return self._scan_cache[1].get(port)
 
     def get_port_map(self) -> PortMap:
         """Get complete port map."""
@@ -204,10 +350,17 @@ class PortManager:
         return self.port_map
 
 
+def _by_port(mapping: Dict[int, object]) -> Iterable[Tuple[int, object]]:
+    """Items in port order, sorting only when the mapping is not a SortedDict."""
+    if SortedDict is not None and isinstance(mapping, SortedDict):
+        return mapping.items()
+    return sorted(mapping.items())
+
+
 def format_port_map(port_map: PortMap, format_type: str = "text") -> str:
     """Format port map for display."""
     if format_type == "json":
-        return json.dumps(
+        return _dumps(
             {
                 "ports": [
                     {
@@ -219,36 +372,23 @@ def format_port_map(port_map: PortMap, format_type: str = "text") -> str:
                     for p in port_map.ports.values()
                 ],
                 "reservations": port_map.reservations,
-            },
-            indent=2,
+            }
         )
 
     lines = ["=== Port Map ===", ""]
 
-    # Group by status
-    reserved = []
-    in_use = []
-    available = []
-
-    for port, info in sorted(port_map.ports.items()):
-        in_use.append(info)
-
-    for port, desc in sorted(port_map.reservations.items()):
-        reserved.append((port, desc))
-
+    # Each section is built in one pass straight from the port-ordered items
+    reserved = [f"  {port}: {desc}" for port, desc in _by_port(port_map.reservations)]
     if reserved:
-        lines.append("Reserved Ports:")
-        for port, desc in reserved:
-            lines.append(f"  {port}: {desc}")
-        lines.append("")
+        lines += ["Reserved Ports:", *reserved, ""]
 
+    in_use = [
+        f"  {info.port}/{info.protocol}: {info.process or 'unknown'}"
+        + (f" (PID: {info.pid})" if info.pid else "")
+        for _, info in _by_port(port_map.ports)
+    ]
     if in_use:
-        lines.append("Active Ports:")
-        for info in in_use:
-            proc = info.process or "unknown"
-            pid = f" (PID: {info.pid})" if info.pid else ""
-            lines.append(f"  {info.port}/{info.protocol}: {proc}{pid}")
-        lines.append("")
+        lines += ["Active Ports:", *in_use, ""]
 
     return "\n".join(lines)
 
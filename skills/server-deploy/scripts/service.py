@@ -4,14 +4,173 @@ Service Manager Script
 
 Source: Derived from anthropics/skills PR #151 (geepers agent system)
 
-Manage system services using systemctl.
+Manage system services over systemd's DBus API, falling back to systemctl.
 """
 
 import argparse
+import ctypes
+import io
 import json
+import os
+import signal
 import subprocess
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Tuple
+
+# Talk to systemd directly over the system bus when jeepney is installed
+try:
+    from jeepney import DBusAddress, MatchRule, Properties, message_bus, new_method_call
+    from jeepney.io.blocking import open_dbus_connection
+    from jeepney.wrappers import DBusErrorResponse, unwrap_msg
+
+    _SYSTEMD_MANAGER = DBusAddress(
+        "/org/freedesktop/systemd1",
+        bus_name="org.freedesktop.systemd1",
+        interface="org.freedesktop.systemd1.Manager",
+    )
+    # The bus daemon resolves the well-known sender name; jeepney's local
+    # filter only sees unique names, so it matches without one
+    _JOB_REMOVED = MatchRule(
+        type="signal",
+        sender="org.freedesktop.systemd1",
+        path="/org/freedesktop/systemd1",
+        interface="org.freedesktop.systemd1.Manager",
+        member="JobRemoved",
+    )
+    _JOB_REMOVED_LOCAL = MatchRule(
+        type="signal",
+        path="/org/freedesktop/systemd1",
+        interface="org.freedesktop.systemd1.Manager",
+        member="JobRemoved",
+    )
+except ImportError:
+    open_dbus_connection = None
+
+
+class _SdBusError(ctypes.Structure):
+    """Mirror of libsystemd's sd_bus_error."""
+    _fields_ = [("name", ctypes.c_char_p), ("message", ctypes.c_char_p), ("_need_free", ctypes.c_int)]
+
+
+# sd_bus_message_handler_t: (sd_bus_message *m, void *userdata, sd_bus_error *ret_error)
+_SdBusHandler = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p, ctypes.POINTER(_SdBusError))
+
+# Same signal as _JOB_REMOVED, in sd-bus match syntax
+_SD_JOB_REMOVED = (
+    b"type='signal',sender='org.freedesktop.systemd1',path='/org/freedesktop/systemd1',"
+    b"interface='org.freedesktop.systemd1.Manager',member='JobRemoved'"
+)
+
+# Without jeepney, service actions go through libsystemd's sd-bus directly
+try:
+    _libsystemd = ctypes.CDLL("libsystemd.so.0")
+    _libsystemd.sd_bus_open_system.argtypes = [ctypes.POINTER(ctypes.c_void_p)]
+    _libsystemd.sd_bus_open_system.restype = ctypes.c_int
+    # Fixed parameters only; the variadic tail is typed per call site
+    _libsystemd.sd_bus_call_method.argtypes = [
+        ctypes.c_void_p,  # bus
+        ctypes.c_char_p,  # destination
+        ctypes.c_char_p,  # path
+        ctypes.c_char_p,  # interface
+        ctypes.c_char_p,  # member
+        ctypes.POINTER(_SdBusError),  # ret_error
+        ctypes.POINTER(ctypes.c_void_p),  # reply, or NULL to discard it
+        ctypes.c_char_p,  # signature of the variadic arguments
+    ]
+    _libsystemd.sd_bus_call_method.restype = ctypes.c_int
+    _libsystemd.sd_bus_error_free.argtypes = [ctypes.POINTER(_SdBusError)]
+    _libsystemd.sd_bus_error_free.restype = None
+    # Variadic like sd_bus_call_method: fixed message and signature, then pointers
+    _libsystemd.sd_bus_message_read.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+    _libsystemd.sd_bus_message_read.restype = ctypes.c_int
+    _libsystemd.sd_bus_message_unref.argtypes = [ctypes.c_void_p]
+    _libsystemd.sd_bus_message_unref.restype = ctypes.c_void_p
+    _libsystemd.sd_bus_add_match.argtypes = [
+        ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p), ctypes.c_char_p, _SdBusHandler, ctypes.c_void_p,
+    ]
+    _libsystemd.sd_bus_add_match.restype = ctypes.c_int
+    _libsystemd.sd_bus_slot_unref.argtypes = [ctypes.c_void_p]
+    _libsystemd.sd_bus_slot_unref.restype = ctypes.c_void_p
+    _libsystemd.sd_bus_process.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p)]
+    _libsystemd.sd_bus_process.restype = ctypes.c_int
+    _libsystemd.sd_bus_wait.argtypes = [ctypes.c_void_p, ctypes.c_uint64]
+    _libsystemd.sd_bus_wait.restype = ctypes.c_int
+except OSError:
+    _libsystemd = None
+
+
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        """Serialize to indented JSON with orjson, which encodes dataclasses natively."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _dumps(obj) -> str:
+        """Serialize to indented JSON, expanding dataclasses to dicts."""
+        return json.dumps(obj, indent=2, default=asdict)
+
+
+DBUS_TIMEOUT = 10.0
+
+# JobRemoved results systemctl treats as success
+_JOB_OK_RESULTS = ("done", "skipped")
+
+# Seconds sudo gets to relay SIGTERM to a timed-out systemctl before SIGKILL
+SUDO_KILL_GRACE = 2.0
+
+# Suffixes systemd accepts on unit names; anything else is treated as a .service
+_UNIT_SUFFIXES = (
+    ".service", ".socket", ".target", ".timer", ".mount", ".automount",
+    ".path", ".slice", ".scope", ".swap", ".device",
+)
+
+# Services reported by list_services, in display order
+_COMMON_SERVICES = (
+    "caddy",
+    "postgresql",
+    "nginx",
+    "docker",
+    "ssh",
+    "cron",
+)
+
+
+def _run_systemctl(args: List[str], timeout: float, sudo: bool = False) -> subprocess.CompletedProcess:
+    """Run systemctl so that a hung call is killed and reaped, never leaked.
+
+    Unprivileged calls get their own session and the whole process group is
+    SIGKILLed on timeout. Under sudo the command line stays "sudo systemctl
+    ..." so sudoers rules for systemctl keep matching, and sudo stays in our
+    process group for its password prompt; on timeout sudo gets SIGTERM,
+    which it relays to systemctl, then SIGKILL if it has not exited.
+    """
+    cmd = ["systemctl", *args]
+    if sudo:
+        cmd = ["sudo", *cmd]
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        start_new_session=not sudo,
+    )
+    try:
+        stdout, stderr = proc.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        if sudo:
+            proc.terminate()
+            try:
+                proc.wait(timeout=SUDO_KILL_GRACE)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+        else:
+            os.killpg(proc.pid, signal.SIGKILL)
+            proc.communicate()
+        raise
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
 
 
 @dataclass
@@ -27,149 +186,348 @@ class ServiceInfo:
 class ServiceManager:
     """Manage system services."""
 
+    # Seconds a probed ServiceInfo is reused by status queries
+    STATUS_TTL = 1.0
+
     def __init__(self):
         self.services: Dict[str, ServiceInfo] = {}
+        self._status_cache: Dict[str, Tuple[float, ServiceInfo]] = {}
+        # One system bus connection shared by every call; None means use systemctl
+        self._bus = self._open_bus()
+        self._sd_bus = self._open_sd_bus() if self._bus is None else None
 
-    def get_service_status(self, service_name: str) -> ServiceInfo:
-        """Get status of a single service."""
+    @staticmethod
+    def _open_bus():
+        """Connect to the system bus, or return None if DBus is unavailable."""
+        if open_dbus_connection is None:
+            return None
         try:
-            # Check if service exists
-            result = subprocess.run(
-                ["systemctl", "status", service_name],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
+            return open_dbus_connection(bus="SYSTEM")
+        except Exception:
+            return None
 
-            # Check active status
-            active_result = subprocess.run(
-                ["systemctl", "is-active", service_name],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            status = active_result.stdout.strip()
-
-            # Check enabled status
-            enabled_result = subprocess.run(
-                ["systemctl", "is-enabled", service_name],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            enabled = enabled_result.stdout.strip() == "enabled"
-
-            return ServiceInfo(
-                name=service_name,
-                display_name=service_name,
-                status=status if status in ["active", "inactive", "failed"] else "unknown",
-                enabled=enabled,
-                running=status == "active",
-            )
-        except subprocess.TimeoutExpired:
-            return ServiceInfo(
-                name=service_name,
-                display_name=service_name,
-                status="unknown",
-                enabled=False,
-                running=False,
-            )
-        except FileNotFoundError:
-            return ServiceInfo(
-                name=service_name,
-                display_name=service_name,
-                status="unknown",
-                enabled=False,
-                running=False,
+    @staticmethod
+    def _open_sd_bus() -> Optional[ctypes.c_void_p]:
+        """Open an sd-bus system connection, or return None if unavailable."""
+        if _libsystemd is None:
+            return None
+        bus = ctypes.c_void_p()
+        if _libsystemd.sd_bus_open_system(ctypes.byref(bus)) < 0:
+            return None
+        return bus
+
+    def _sd_bus_call(
+        self, method: str, signature: Optional[bytes] = None, *args, reply: Optional[ctypes.c_void_p] = None
+    ) -> bool:
+        """Call a Manager method over sd-bus, storing the reply in reply if given.
+
+        The caller owns a stored reply and must sd_bus_message_unref it.
+        """
+        error = _SdBusError()
+        ret = _libsystemd.sd_bus_call_method(
+            self._sd_bus,
+            b"org.freedesktop.systemd1",
+            b"/org/freedesktop/systemd1",
+            b"org.freedesktop.systemd1.Manager",
+            method.encode(),
+            ctypes.byref(error),
+            None if reply is None else ctypes.byref(reply),
+            signature,
+            *args,
+        )
+        _libsystemd.sd_bus_error_free(ctypes.byref(error))
+        return ret >= 0
+
+    @staticmethod
+    def _unit_name(service_name: str) -> str:
+        """Expand a bare service name the way systemctl does."""
+        if service_name.endswith(_UNIT_SUFFIXES):
+            return service_name
+        return f"{service_name}.service"
+
+    def _call(self, address, method: str, signature: Optional[str] = None, body: tuple = ()) -> tuple:
+        """Send a method call on the shared bus and return the reply body."""
+        msg = new_method_call(address, method, signature, body)
+        return unwrap_msg(self._bus.send_and_get_reply(msg, timeout=DBUS_TIMEOUT))
+
+    def _dbus_status(self, service_name: str) -> ServiceInfo:
+        """Read ActiveState and UnitFileState from the unit object in one GetAll."""
+        (unit_path,) = self._call(_SYSTEMD_MANAGER, "LoadUnit", "s", (self._unit_name(service_name),))
+        unit = DBusAddress(
+            unit_path,
+            bus_name="org.freedesktop.systemd1",
+            interface="org.freedesktop.systemd1.Unit",
+        )
+        props = unwrap_msg(
+            self._bus.send_and_get_reply(Properties(unit).get_all(), timeout=DBUS_TIMEOUT)
+        )[0]
+        return self._service_info(service_name, props["ActiveState"][1], props["UnitFileState"][1])
+
+    @staticmethod
+    def _service_info(service_name: str, active_state: str, unit_file_state: str) -> ServiceInfo:
+        """Build a ServiceInfo from systemd's ActiveState and UnitFileState."""
+        return ServiceInfo(
+            name=service_name,
+            display_name=service_name,
+            status=active_state if active_state in ["active", "inactive", "failed"] else "unknown",
+            enabled=unit_file_state == "enabled",
+            running=active_state == "active",
+        )
+
+    def _dbus_list(self, names: List[str]) -> List[ServiceInfo]:
+        """Fetch every unit's state in two round trips regardless of count."""
+        units = [self._unit_name(name) for name in names]
+        (listed,) = self._call(_SYSTEMD_MANAGER, "ListUnitsByNames", "as", (units,))
+        active = {entry[0]: entry[3] for entry in listed}
+        (files,) = self._call(_SYSTEMD_MANAGER, "ListUnitFilesByPatterns", "asas", ([], units))
+        file_states = {path.rpartition("/")[2]: state for path, state in files}
+        return [
+            self._service_info(name, active.get(unit, "unknown"), file_states.get(unit, ""))
+            for name, unit in zip(names, units)
+        ]
+
+    def _systemctl_list(self, names: List[str]) -> List[ServiceInfo]:
+        """Fetch every unit's state with a single systemctl show."""
+        try:
+            result = _run_systemctl(
+                ["show", "--no-pager", "-p", "ActiveState", "-p", "UnitFileState",
+                 *(self._unit_name(name) for name in names)],
+                timeout=10,
             )
+            # One blank-line separated block per unit, in argument order
+            blocks = result.stdout.strip().split("\n\n")
         except Exception:
-            return ServiceInfo(
-                name=service_name,
-                display_name=service_name,
-                status="unknown",
-                enabled=False,
-                running=False,
+            blocks = []
+        if len(blocks) != len(names):
+            return [self._service_info(name, "unknown", "") for name in names]
+
+        services = []
+        for name, block in zip(names, blocks):
+            props = dict(line.partition("=")[::2] for line in block.splitlines())
+            services.append(
+                self._service_info(name, props.get("ActiveState", "unknown"), props.get("UnitFileState", ""))
             )
+        return services
+
+    def _dbus_action(self, method: str, service_name: str, timeout: float) -> Optional[bool]:
+        """Run a Manager job or unit-file method over DBus.
+
+        Job methods wait up to timeout seconds for the job to finish, as
+        systemctl does, and report whether it succeeded. None means DBus is
+        unavailable or refused the call, so the caller should use systemctl.
+        """
+        unit = self._unit_name(service_name)
+        if self._bus is None:
+            return None if self._sd_bus is None else self._sd_bus_action(method, unit, timeout)
+        try:
+            if method == "EnableUnitFiles":
+                self._call(_SYSTEMD_MANAGER, method, "asbb", ([unit], False, False))
+                self._call(_SYSTEMD_MANAGER, "Reload")
+            elif method == "DisableUnitFiles":
+                self._call(_SYSTEMD_MANAGER, method, "asb", ([unit], False))
+                self._call(_SYSTEMD_MANAGER, "Reload")
+            else:
+                return self._dbus_job(method, unit, timeout)
+            return True
+        except (DBusErrorResponse, OSError, TimeoutError):
+            return None
+
+    def _dbus_job(self, method: str, unit: str, timeout: float) -> bool:
+        """Queue a start/stop/restart job and wait for its JobRemoved signal.
+
+        The job methods return as soon as the job is queued, so the result
+        only arrives in the signal. Raises like _call if queueing fails.
+        """
+        # Subscribe before queueing so a job that finishes at once is not missed
+        with self._bus.filter(_JOB_REMOVED_LOCAL, bufsize=256) as removed:
+            unwrap_msg(self._bus.send_and_get_reply(message_bus.AddMatch(_JOB_REMOVED), timeout=DBUS_TIMEOUT))
+            try:
+                (job,) = self._call(_SYSTEMD_MANAGER, method, "ss", (unit, "replace"))
+                deadline = time.monotonic() + timeout
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    try:
+                        signal_msg = self._bus.recv_until_filtered(removed, timeout=remaining)
+                    except TimeoutError:
+                        return False
+                    _, path, _, result = signal_msg.body
+                    if path == job:
+                        return result in _JOB_OK_RESULTS
+            finally:
+                try:
+                    self._bus.send_and_get_reply(message_bus.RemoveMatch(_JOB_REMOVED), timeout=DBUS_TIMEOUT)
+                except (DBusErrorResponse, OSError, TimeoutError):
+                    pass
+
+    def _sd_bus_action(self, method: str, unit: str, timeout: float) -> Optional[bool]:
+        """sd-bus counterpart of _dbus_action; arrays are passed as count, items.
+
+        Variadic arguments get no ctypes conversion, so each is wrapped in the
+        C type sd-bus reads for its signature code: unsigned count for "as",
+        char * for "s", int for "b".
+        """
+        name = ctypes.c_char_p(unit.encode())
+        one, false = ctypes.c_uint32(1), ctypes.c_int(0)
+        if method == "EnableUnitFiles":
+            ok = self._sd_bus_call(method, b"asbb", one, name, false, false)
+        elif method == "DisableUnitFiles":
+            ok = self._sd_bus_call(method, b"asb", one, name, false)
+        else:
+            return self._sd_bus_job(method, name, timeout)
+        return True if ok and self._sd_bus_call("Reload") else None
+
+    def _sd_bus_job(self, method: str, name: ctypes.c_char_p, timeout: float) -> Optional[bool]:
+        """sd-bus counterpart of _dbus_job; None if the job could not be queued."""
+        removed: Dict[bytes, bytes] = {}
+
+        @_SdBusHandler
+        def on_job_removed(msg, userdata, ret_error):
+            job_id, path, unit, result = ctypes.c_uint32(), ctypes.c_char_p(), ctypes.c_char_p(), ctypes.c_char_p()
+            if _libsystemd.sd_bus_message_read(
+                msg, b"uoss", ctypes.byref(job_id), ctypes.byref(path), ctypes.byref(unit), ctypes.byref(result)
+            ) > 0:
+                removed[path.value] = result.value
+            return 0
+
+        # Subscribe before queueing so a job that finishes at once is not missed
+        slot = ctypes.c_void_p()
+        if _libsystemd.sd_bus_add_match(self._sd_bus, ctypes.byref(slot), _SD_JOB_REMOVED, on_job_removed, None) < 0:
+            return None
+        reply = ctypes.c_void_p()
+        try:
+            if not self._sd_bus_call(method, b"ss", name, ctypes.c_char_p(b"replace"), reply=reply):
+                return None
+            job = ctypes.c_char_p()
+            if _libsystemd.sd_bus_message_read(reply, b"o", ctypes.byref(job)) <= 0:
+                return False
+            job = job.value  # Copied out before the reply is freed
+
+            deadline = time.monotonic() + timeout
+            while job not in removed:
+                processed = _libsystemd.sd_bus_process(self._sd_bus, None)
+                if processed < 0:
+                    return False
+                if processed > 0:
+                    continue  # More may be queued; drain before waiting
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                _libsystemd.sd_bus_wait(self._sd_bus, int(remaining * 1e6))
+            return removed[job].decode() in _JOB_OK_RESULTS
+        finally:
+            _libsystemd.sd_bus_message_unref(reply)
+            _libsystemd.sd_bus_slot_unref(slot)
+
+    def _cached_status(self, service_name: str, now: float) -> Optional[ServiceInfo]:
+        """Return a status probed less than STATUS_TTL seconds ago, if any."""
+        entry = self._status_cache.get(service_name)
+        if entry is not None and now - entry[0] < self.STATUS_TTL:
+            return entry[1]
+        return None
+
+    def get_service_status(self, service_name: str) -> ServiceInfo:
+        """Get status of a single service.
+
+        Repeated queries within STATUS_TTL seconds reuse the last probe.
+        """
+        now = time.monotonic()
+        info = self._cached_status(service_name, now)
+        if info is None:
+            info = self._probe_status(service_name)
+            self._status_cache[service_name] = (now, info)
+        return info
+
+    def _probe_status(self, service_name: str) -> ServiceInfo:
+        """Query systemd for a single service's status."""
+        if self._bus is not None:
+            try:
+                return self._dbus_status(service_name)
+            except (DBusErrorResponse, OSError, TimeoutError, KeyError):
+                pass
+
+        # One systemctl show replaces separate status/is-active/is-enabled calls
+        return self._systemctl_list([service_name])[0]
 
     def list_services(self) -> List[ServiceInfo]:
-        """List status of common services."""
-        common_services = [
-            "caddy",
-            "postgresql",
-            "nginx",
-            "docker",
-            "ssh",
-            "cron",
-        ]
+        """List status of common services with one batched query."""
+        now = time.monotonic()
+        cached = {name: self._cached_status(name, now) for name in _COMMON_SERVICES}
+        missing = [name for name, info in cached.items() if info is None]
+        if missing:
+            for info in self._probe_list(missing):
+                self._status_cache[info.name] = (now, info)
+                cached[info.name] = info
 
-        services = []
-        for name in common_services:
-            info = self.get_service_status(name)
-            services.append(info)
+        return [cached[name] for name in _COMMON_SERVICES]
 
-        return services
+    def _probe_list(self, names: List[str]) -> List[ServiceInfo]:
+        """Query systemd for several services in one batch."""
+        if self._bus is not None:
+            try:
+                return self._dbus_list(names)
+            except (DBusErrorResponse, OSError, TimeoutError):
+                pass
+
+        return self._systemctl_list(names)
 
     def start_service(self, service_name: str) -> bool:
         """Start a service."""
+        self._status_cache.pop(service_name, None)
+        ok = self._dbus_action("StartUnit", service_name, timeout=30)
+        if ok is not None:
+            return ok
         try:
-            result = subprocess.run(
-                ["sudo", "systemctl", "start", service_name],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
+            result = _run_systemctl(["start", service_name], timeout=30, sudo=True)
             return result.returncode == 0
         except Exception:
             return False
 
     def stop_service(self, service_name: str) -> bool:
         """Stop a service."""
+        self._status_cache.pop(service_name, None)
+        ok = self._dbus_action("StopUnit", service_name, timeout=30)
+        if ok is not None:
+            return ok
         try:
-            result = subprocess.run(
-                ["sudo", "systemctl", "stop", service_name],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
+            result = _run_systemctl(["stop", service_name], timeout=30, sudo=True)
             return result.returncode == 0
         except Exception:
             return False
 
     def restart_service(self, service_name: str) -> bool:
         """Restart a service."""
+        self._status_cache.pop(service_name, None)
+        ok = self._dbus_action("RestartUnit", service_name, timeout=60)
+        if ok is not None:
+            return ok
         try:
-            result = subprocess.run(
-                ["sudo", "systemctl", "restart", service_name],
-                capture_output=True,
-                text=True,
-                timeout=60,
-            )
+            result = _run_systemctl(["restart", service_name], timeout=60, sudo=True)
             return result.returncode == 0
         except Exception:
             return False
 
     def enable_service(self, service_name: str) -> bool:
         """Enable service at boot."""
+        self._status_cache.pop(service_name, None)
+        ok = self._dbus_action("EnableUnitFiles", service_name, timeout=30)
+        if ok is not None:
+            return ok
         try:
-            result = subprocess.run(
-                ["sudo", "systemctl", "enable", service_name],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
+            result = _run_systemctl(["enable", service_name], timeout=30, sudo=True)
             return result.returncode == 0
         except Exception:
             return False
 
     def disable_service(self, service_name: str) -> bool:
         """Disable service at boot."""
+        self._status_cache.pop(service_name, None)
+        ok = self._dbus_action("DisableUnitFiles", service_name, timeout=30)
+        if ok is not None:
+            return ok
         try:
-            result = subprocess.run(
-                ["sudo", "systemctl", "disable", service_name],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
+            result = _run_systemctl(["disable", service_name], timeout=30, sudo=True)
             return result.returncode == 0
         except Exception:
             return False
@@ -178,27 +536,16 @@ class ServiceManager:
 def format_services(services: List[ServiceInfo], format_type: str = "text") -> str:
     """Format service list for display."""
     if format_type == "json":
-        return json.dumps(
-            [
-                {
-                    "name": s.name,
-                    "display_name": s.display_name,
-                    "status": s.status,
-                    "enabled": s.enabled,
-                    "running": s.running,
-                }
-                for s in services
-            ],
-            indent=2,
-        )
+        return _dumps(services)
 
-    lines = ["=== Service Status ===", ""]
+    buf = io.StringIO()
+    buf.write("=== Service Status ===\n")
     for s in services:
         status_icon = "✓" if s.running else "✗"
         enabled_str = "enabled" if s.enabled else "disabled"
-        lines.append(f"{s.name}: {s.status.upper()} {status_icon} ({enabled_str})")
+        buf.write(f"\n{s.name}: {s.status.upper()} {status_icon} ({enabled_str})")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 if __name__ == "__main__":
@@ -221,12 +568,12 @@ if __name__ == "__main__":
         if args.service:
             service = manager.get_service_status(args.service)
             if args.json:
-                print(json.dumps({
+                print(_dumps({
                     "name": service.name,
                     "status": service.status,
                     "running": service.running,
                     "enabled": service.enabled,
-                }, indent=2))
+                }))
             else:
                 print(f"Service: {service.name}")
                 print(f"Status: {service.status}")
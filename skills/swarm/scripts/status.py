@@ -8,20 +8,34 @@ Check swarm session status and aggregate results.
 """
 
 import argparse
+import io
 import json
-from datetime import datetime
+
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        """Serialize to indented JSON with orjson's native encoder."""
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _dumps(obj) -> str:
+        """Serialize to indented JSON."""
+        return json.dumps(obj, indent=2, default=str)
 
 
 def get_session_status(session_id: str) -> dict:
     """Get status of a swarm session."""
+    from datetime import datetime
+
+    now_iso = datetime.now().isoformat()
     # Return mock status for demo
     return {
         "session_id": session_id,
         "status": "completed",
         "mode": "parallel",
         "agents": 4,
-        "created_at": datetime.now().isoformat(),
-        "completed_at": datetime.now().isoformat(),
+        "created_at": now_iso,
+        "completed_at": now_iso,
         "result": {
             "total_agents": 4,
             "completed_agents": 4,
@@ -61,70 +75,54 @@ def aggregate_results(session_id: str, summarize: bool = False) -> dict:
 def format_status(status: dict, format_type: str = "text") -> str:
     """Format status for display."""
     if format_type == "json":
-        return json.dumps(status, indent=2)
+        return _dumps(status)
 
-    lines = [
-        f"Session: {status['session_id']}",
-        f"Status: {status['status'].upper()}",
-        f"Mode: {status.get('mode', 'N/A')}",
-        f"Agents: {status.get('agents', 'N/A')}",
-        "",
-    ]
+    buf = io.StringIO()
+    buf.write(f"Session: {status['session_id']}\n")
+    buf.write(f"Status: {status['status'].upper()}\n")
+    buf.write(f"Mode: {status.get('mode', 'N/A')}\n")
+    buf.write(f"Agents: {status.get('agents', 'N/A')}\n\n")
 
     result = status.get("result", {})
     if status["status"] == "running":
-        lines.extend([
-            f"Progress: {result.get('completed_agents', 0)}/{result.get('total_agents', 0)}",
-            f"Time: {result.get('execution_time', 0):.1f}s",
-        ])
+        buf.write(f"Progress: {result.get('completed_agents', 0)}/{result.get('total_agents', 0)}\n")
+        buf.write(f"Time: {result.get('execution_time', 0):.1f}s")
     else:
-        lines.extend([
-            f"Completed: {result.get('completed_agents', 0)}/{result.get('total_agents', 0)}",
-            f"Total Time: {result.get('execution_time', 0):.1f}s",
-        ])
+        buf.write(f"Completed: {result.get('completed_agents', 0)}/{result.get('total_agents', 0)}\n")
+        buf.write(f"Total Time: {result.get('execution_time', 0):.1f}s")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def format_aggregation(results: dict, format_type: str = "text") -> str:
     """Format aggregated results."""
     if format_type == "json":
-        return json.dumps(results, indent=2, default=str)
+        return _dumps(results)
 
-    lines = [
-        "# Swarm Aggregation",
-        "",
-        f"**Session**: {results['session_id']}",
-        f"**Task**: {results.get('task', 'N/A')}",
-        "",
-    ]
+    buf = io.StringIO()
+    buf.write("# Swarm Aggregation\n\n")
+    buf.write(f"**Session**: {results['session_id']}\n")
+    buf.write(f"**Task**: {results.get('task', 'N/A')}\n\n")
 
     if results.get("executive_summary"):
-        lines.extend([
-            "## Executive Summary",
-            "",
-            results["executive_summary"],
-            "",
-        ])
+        buf.write("## Executive Summary\n\n")
+        buf.write(results["executive_summary"])
+        buf.write("\n\n")
 
     sections = results.get("sections", [])
     if sections:
-        lines.extend(["## Findings", ""])
+        buf.write("## Findings\n\n")
         for i, section in enumerate(sections):
-            lines.append(f"### {section.get('title', f'Section {i+1}')}")
-            lines.append("")
-            lines.append(section.get("content", ""))
-            lines.append("")
+            buf.write(f"### {section.get('title', f'Section {i+1}')}\n\n")
+            buf.write(section.get("content", ""))
+            buf.write("\n\n")
 
     meta = results.get("metadata", {})
-    lines.extend([
-        "## Metadata",
-        "",
-        f"- Agents: {meta.get('agent_count', 'N/A')}",
-        f"- Time: {meta.get('execution_time', 0):.1f}s",
-    ])
-
-    return "\n".join(lines)
+    buf.write("## Metadata\n\n")
+    buf.write(f"- Agents: {meta.get('agent_count', 'N/A')}\n")
+    buf.write(f"- Time: {meta.get('execution_time', 0):.1f}s")
+
+    return buf.getvalue()
 
 
 def main():
@@ -9,13 +9,30 @@ Execute multi-agent swarm tasks with task distribution and result aggregation.
 
 import argparse
 import asyncio
+import io
 import json
 import sys
-import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        """Serialize to indented JSON with orjson's native encoder."""
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _dumps(obj) -> str:
+        """Serialize to indented JSON."""
+        return json.dumps(obj, indent=2, default=str)
+
+# Each agent gets PER_AGENT_TIMEOUT_SECONDS; a whole gather gets a little
+# extra so per-agent timeouts fire first and the gather limit is a backstop
+PER_AGENT_TIMEOUT_SECONDS = 30.0
+GATHER_BUFFER_SECONDS = 5.0
+GATHER_TIMEOUT = PER_AGENT_TIMEOUT_SECONDS + GATHER_BUFFER_SECONDS
+
 
 @dataclass
 class AgentResult:
@@ -45,14 +62,25 @@ class SwarmSimulator:
 
     MODES = ["parallel", "sequential", "hybrid"]
 
-    def __init__(self, num_agents: int = 4, mode: str = "parallel"):
+    def __init__(
+        self,
+        num_agents: int = 4,
+        mode: str = "parallel",
+        batch_size: int = 4,
+        max_workers: Optional[int] = None,
+    ):
         self.num_agents = num_agents
         self.mode = mode
+        self.batch_size = max(1, batch_size)
+        # Agents allowed in flight at once; defaults to all of them
+        self.max_workers = max(1, max_workers or num_agents)
+        self._slots = None
 
     async def execute(self, task: str, session_id: str = None) -> Dict[str, Any]:
         """Execute swarm task."""
         session_id = session_id or f"swarm_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
+        self._slots = asyncio.Semaphore(self.max_workers)
         if self.mode == "parallel":
             results = await self._execute_parallel(task)
         elif self.mode == "sequential":
@@ -60,11 +88,13 @@ class SwarmSimulator:
         else:  # hybrid
             results = await self._execute_hybrid(task)
 
+        completed = all(r["status"] == "completed" for r in results)
+
         return {
             "session_id": session_id,
             "task": task,
             "mode": self.mode,
-            "status": "completed",
+            "status": "completed" if completed else "partial",
             "results": results,
             "metadata": {
                 "agents": self.num_agents,
@@ -72,60 +102,111 @@ class SwarmSimulator:
             },
         }
 
+    async def _run_agent(self, agent_id: int, task: str, context: Optional[str] = None) -> Dict:
+        """Run one agent on a task, optionally building on an upstream result."""
+        await asyncio.sleep(0.1)
+        result = {
+            "agent_id": f"agent_{agent_id}",
+            "status": "completed",
+            "content": f"Agent {agent_id} processed: {task}",
+            "tokens_used": 100 + agent_id * 10,
+            "execution_time": 0.1,
+        }
+        if context is not None:
+            result["context"] = context
+        return result
+
+    async def _run_agent_bounded(self, agent_id: int, task: str, context: Optional[str] = None) -> Dict:
+        """Run one agent, reporting a timeout result if it exceeds its budget."""
+        # Queueing for a worker slot does not count against the agent's budget
+        async with self._slots:
+            try:
+                return await asyncio.wait_for(
+                    self._run_agent(agent_id, task, context), timeout=PER_AGENT_TIMEOUT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                return _timeout_result(agent_id)
+
+    async def _submit_batch(self, agent_ids: range, task: str) -> List[Dict]:
+        """Submit a chunk of agents to the provider as one request.
+
+        The simulated provider has no native batch endpoint, so the chunk
+        fans out concurrently and the per-agent results come back in order.
+        """
+        return await asyncio.gather(*(self._run_agent_bounded(i, task) for i in agent_ids))
+
     async def _execute_parallel(self, task: str) -> List[Dict]:
-        """Execute agents in parallel."""
-        async def run_agent(agent_id: int):
-            await asyncio.sleep(0.1)
-            return {
-                "agent_id": f"agent_{agent_id}",
-                "status": "completed",
-                "content": f"Agent {agent_id} processed: {task}",
-                "tokens_used": 100 + agent_id * 10,
-                "execution_time": 0.1,
-            }
-
-        tasks = [run_agent(i) for i in range(self.num_agents)]
-        return await asyncio.gather(*tasks)
-
-    async def _execute_sequential(self, task: str) -> List[Dict]:
-        """Execute agents sequentially."""
+        """Execute agents in parallel, batch_size agents per provider request."""
+        chunks = [
+            range(start, min(start + self.batch_size, self.num_agents))
+            for start in range(0, self.num_agents, self.batch_size)
+        ]
+        tasks = [asyncio.ensure_future(self._submit_batch(chunk, task)) for chunk in chunks]
+        # With fewer worker slots than agents, agents run in successive waves
+        waves = -(-self.num_agents // self.max_workers)
+        try:
+            batches = await asyncio.wait_for(asyncio.gather(*tasks), timeout=GATHER_TIMEOUT * waves)
+        except asyncio.TimeoutError:
+            # wait_for cancelled the gather and every batch still pending; let
+            # their cleanup finish (unbounded) and keep whatever completed
+            await asyncio.gather(*tasks, return_exceptions=True)
+            batches = [
+                [_timeout_result(i) for i in chunk] if t.cancelled() else t.result()
+                for chunk, t in zip(chunks, tasks)
+            ]
+        return [result for batch in batches for result in batch]
+
+    async def _execute_sequential(self, task: str, context: Optional[str] = None) -> List[Dict]:
+        """Execute agents as a chain, each consuming the previous agent's output.
+
+        Agents only run one after another because of that dependency;
+        independent agents belong in _execute_parallel.
+        """
         results = []
         for i in range(self.num_agents):
-            await asyncio.sleep(0.1)
-            results.append({
-                "agent_id": f"agent_{i}",
-                "status": "completed",
-                "content": f"Agent {i} processed: {task}",
-                "tokens_used": 100 + i * 10,
-                "execution_time": 0.1,
-            })
+            result = await self._run_agent_bounded(i, task, context)
+            if result["status"] == "completed":
+                context = result["content"]
+            results.append(result)
         return results
 
     async def _execute_hybrid(self, task: str) -> List[Dict]:
         """Execute in hybrid mode (phased)."""
         # Phase 1: Parallel research
         phase1 = await self._execute_parallel(f"{task} (Phase 1)")
-        # Phase 2: Sequential synthesis
-        phase2 = await self._execute_sequential(f"{task} (Phase 2)")
+        # Phase 2: Sequential synthesis over the combined research
+        findings = "\n".join(r["content"] for r in phase1)
+        phase2 = await self._execute_sequential(f"{task} (Phase 2)", findings)
 
         return phase1 + phase2
 
 
+def _timeout_result(agent_id: int) -> Dict:
+    """Placeholder result for an agent that ran out of time."""
+    return {
+        "agent_id": f"agent_{agent_id}",
+        "status": "timeout",
+        "content": "",
+        "tokens_used": 0,
+        "execution_time": PER_AGENT_TIMEOUT_SECONDS,
+    }
+
+
 def format_results(results: List[Dict], format_type: str = "text") -> str:
     """Format swarm results for display."""
     if format_type == "json":
-        return json.dumps(results, indent=2)
+        return _dumps(results)
 
-    lines = [f"Swarm Results ({len(results)} agents):", ""]
+    buf = io.StringIO()
+    buf.write(f"Swarm Results ({len(results)} agents):\n")
 
     for r in results:
-        lines.append(f"Agent: {r['agent_id']}")
-        lines.append(f"  Status: {r['status']}")
-        lines.append(f"  Content: {r['content'][:100]}...")
-        lines.append(f"  Tokens: {r['tokens_used']}")
-        lines.append("")
+        buf.write(f"\nAgent: {r['agent_id']}\n")
+        buf.write(f"  Status: {r['status']}\n")
+        buf.write(f"  Content: {r['content'][:100]}...\n")
+        buf.write(f"  Tokens: {r['tokens_used']}\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def main():
@@ -147,6 +228,14 @@ def main():
         choices=["parallel", "sequential", "hybrid"],
         help="Execution mode (default: parallel)"
     )
+    parser.add_argument(
+        "--batch-size", type=int, default=4,
+        help="Agents submitted per provider request in parallel mode (default: 4)"
+    )
+    parser.add_argument(
+        "--max-workers", type=int,
+        help="Maximum agents in flight at once (default: all agents)"
+    )
     parser.add_argument(
         "--session", "-s", help="Session ID for continuing swarm"
     )
@@ -169,12 +258,12 @@ def main():
         print(f"  Agents: {args.agents}")
 
     # Execute swarm
-    swarm = SwarmSimulator(args.agents, args.mode)
+    swarm = SwarmSimulator(args.agents, args.mode, args.batch_size, args.max_workers)
     result = asyncio.run(swarm.execute(args.task or "Continued task", args.session))
 
     # Output
     if args.output == "json":
-        print(json.dumps(result, indent=2, default=str))
+        print(_dumps(result))
     elif args.output == "markdown":
         print(f"# Swarm Results")
         print(f"")
@@ -12,9 +12,10 @@ Source: Derived from anthropics/skills PR #170 (MIT License)
 """
 
 import argparse
+import io
 import json
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 from enum import Enum
 
 
@@ -65,6 +66,35 @@ JURISDICTIONS = {
 }
 
 
+# Sections every filing must contain, and the order body sections are rendered in
+_REQUIRED_SECTIONS = ("caption", "introduction")
+_SECTION_ORDER = ("introduction", "statement_of_issues", "statement_of_the_case",
+                  "argument", "conclusion", "relief_requested")
+_SECTION_HEADERS = {name: f"\n\n## {name.upper().replace('_', ' ')}\n" for name in _SECTION_ORDER}
+
+
+def _format_identity(citation: str) -> str:
+    """Leave a citation unchanged."""
+    return citation
+
+
+def _format_bluebook(citation: str) -> str:
+    """Basic Bluebook formatting."""
+    return citation
+
+
+def _format_state(citation: str) -> str:
+    """Basic state reporter formatting."""
+    return citation
+
+
+# Citation formatter per JurisdictionConfig.citation_format, resolved once per generator
+_CITATION_FORMATTERS: Dict[str, Callable[[str], str]] = {
+    "Bluebook": _format_bluebook,
+    "State": _format_state,
+}
+
+
 class LegalDocumentGenerator:
     """Generate court-ready legal documents."""
 
@@ -72,15 +102,23 @@ class LegalDocumentGenerator:
         self.jurisdiction = jurisdiction
         self.config = JURISDICTIONS.get(jurisdiction, JURISDICTIONS["federal_district"])
         self.sections: Dict[str, str] = {}
+        # Sum of len() over self.sections, maintained by add_section
+        self._total_length = 0
+        self._format_citation = _CITATION_FORMATTERS.get(self.config.citation_format, _format_identity)
 
     def add_section(self, name: str, content: str):
         """Add a document section."""
+        self._total_length += len(content) - len(self.sections.get(name, ""))
         self.sections[name] = content
 
     def generate_caption(self, case_data: Dict) -> str:
-        """Generate document caption."""
+        """Generate document caption.
+
+        Reads court_name, case_number, party_names and document_title from
+        case_data, with placeholder defaults for any that are missing.
+        """
         return f"""
-{court_name}
+{case_data.get('court_name', 'United States District Court')}
 Case No. {case_data.get('case_number', 'XX-XXXX')}
 
 {case_data.get('party_names', 'Party A v. Party B')}
@@ -90,54 +128,58 @@ Document Title: {case_data.get('document_title', 'Motion')}
 
     def format_citation(self, citation: str) -> str:
         """Format citation according to jurisdiction rules."""
-        if self.config.citation_format == "Bluebook":
-            # Basic Bluebook formatting
-            return citation
-        return citation
+        return self._format_citation(citation)
 
     def check_compliance(self) -> List[str]:
         """Check document compliance with court rules."""
         issues = []
 
         # Check sections
-        required_sections = ["caption", "introduction"]
-        for section in required_sections:
+        for section in _REQUIRED_SECTIONS:
             if section not in self.sections:
                 issues.append(f"Missing required section: {section}")
 
         # Check content length
-        total_length = sum(len(s) for s in self.sections.values())
-        if total_length < 100:
+        if self._total_length < 100:
             issues.append("Document content appears too brief")
 
         return issues
 
-    def generate(self, document_type: DocumentType = DocumentType.BRIEF) -> str:
-        """Generate the complete document."""
-        compliance = self.check_compliance()
-        if compliance:
-            print(f"Compliance issues found: {compliance}")
+    def generate(self, document_type: DocumentType = DocumentType.BRIEF, validate: bool = True) -> str:
+        """Generate the complete document.
 
-        # Generate document in proper order
-        document_parts = []
+        Pass validate=False to skip compliance checking, e.g. for previews.
+        """
+        if validate:
+            compliance = self.check_compliance()
+            if compliance:
+                print(f"Compliance issues found: {compliance}")
+
+        # Generate document in proper order, streaming parts into one buffer
+        sections = self.sections
+        buf = io.StringIO()
 
         # Caption
-        if "caption" in self.sections:
-            document_parts.append(self.sections["caption"])
+        started = "caption" in sections
+        if started:
+            buf.write(sections["caption"])
 
         # Other sections in order
-        order = ["introduction", "statement_of_issues", "statement_of_the_case",
-                 "argument", "conclusion", "relief_requested"]
-
-        for section_name in order:
-            if section_name in self.sections:
-                document_parts.append(f"\n\n## {section_name.upper().replace('_', ' ')}\n")
-                document_parts.append(self.sections[section_name])
+        for section_name in _SECTION_ORDER:
+            content = sections.get(section_name)
+            if content is not None:
+                if started:
+                    buf.write("\n")
+                started = True
+                buf.write(_SECTION_HEADERS[section_name])
+                buf.write("\n")
+                buf.write(content)
 
-        return "\n".join(document_parts)
+        return buf.getvalue()
 
 
-def generate_motion(template: str, jurisdiction: str, data: Dict, output: str = None):
+def generate_motion(template: str, jurisdiction: str, data: Dict, output: str = None,
+                    validate: bool = True):
     """Convenience function to generate a motion document."""
     generator = LegalDocumentGenerator(jurisdiction)
 
@@ -146,7 +188,7 @@ def generate_motion(template: str, jurisdiction: str, data: Dict, output: str =
         generator.add_section(section, content)
 
     # Generate
-    document = generator.generate(DocumentType.MOTION)
+    document = generator.generate(DocumentType.MOTION, validate=validate)
 
     if output:
         with open(output, 'w') as f:
@@ -179,6 +221,11 @@ def main():
         '--data', '-d',
         help='JSON file with document data'
     )
+    parser.add_argument(
+        '--no-validate',
+        action='store_true',
+        help='Skip compliance checking (faster preview rendering)'
+    )
 
     args = parser.parse_args()
 
@@ -193,7 +240,8 @@ def main():
         template=args.template,
         jurisdiction=args.jurisdiction,
         data=data,
-        output=args.output
+        output=args.output,
+        validate=not args.no_validate
     )
 
     if not args.output: